@@ -7,6 +7,9 @@ Teams are ranked by their composite SCORE, not dollar value.
 Version: 2.0.0
 """
 
+import html
+
+import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 
@@ -14,7 +17,7 @@ from src.theme import (
     get_custom_css, COLORS, render_brand_header, render_metric_card,
     render_team_row, render_sample_data_banner, get_team_logo
 )
-from src.data import get_team_data, get_summary_stats, CONFERENCES
+from src.data import get_team_data, get_summary_stats, get_last_updated, get_portal_rankings, CONFERENCES
 
 # Page configuration
 st.set_page_config(
@@ -72,7 +75,7 @@ with st.sidebar:
     st.markdown(
         f"""
         <div style="color: {COLORS['text_muted']}; font-size: 0.6875rem; line-height: 1.5;">
-            <p style="margin-bottom: 0.25rem;">Last updated: Jan 18, 2026</p>
+            <p style="margin-bottom: 0.25rem;">Last updated: {get_last_updated()}</p>
             <p>Data: Sample Data (Demo)</p>
         </div>
         """,
@@ -236,6 +239,45 @@ with col_right:
 
     st.plotly_chart(fig2, use_container_width=True)
 
+# Scraped 247Sports portal rankings (published by the refresh worker)
+portal_rankings = get_portal_rankings()
+if portal_rankings is not None:
+    st.markdown("<div style='height: 1.5rem;'></div>", unsafe_allow_html=True)
+    st.markdown('<div class="section-header">Live Portal Rankings</div>', unsafe_allow_html=True)
+    st.markdown(f'<p style="color: {COLORS["text_muted"]}; font-size: 0.8125rem; margin-bottom: 1rem;">Committed transfers scraped from 247Sports, ranked by count and rating</p>', unsafe_allow_html=True)
+
+    ranking_rows = ""
+    for _, row in portal_rankings.head(25).iterrows():
+        avg_rating = f"{row['Avg_Rating']:.4f}" if pd.notna(row["Avg_Rating"]) else "—"
+        ranking_rows += f"""
+        <tr>
+            <td><strong>{row["Rank"]}</strong></td>
+            <td>{html.escape(str(row["Team"]))}</td>
+            <td>{row["Transfers"]}</td>
+            <td>{avg_rating}</td>
+            <td style="font-weight: 600;">{row["Score"]:.1f}</td>
+        </tr>
+        """
+
+    st.markdown(f"""
+        <div class="data-table-container">
+            <table class="data-table">
+                <thead>
+                    <tr>
+                        <th>Rank</th>
+                        <th>Team</th>
+                        <th>Transfers</th>
+                        <th>Avg Rating</th>
+                        <th>Score</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {ranking_rows}
+                </tbody>
+            </table>
+        </div>
+    """, unsafe_allow_html=True)
+
 # Footer
 st.markdown("<div style='height: 2rem;'></div>", unsafe_allow_html=True)
 st.markdown(
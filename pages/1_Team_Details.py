@@ -10,7 +10,7 @@ import pandas as pd
 import plotly.graph_objects as go
 
 from src.theme import get_custom_css, COLORS, TEAM_COLORS, get_team_logo, render_brand_header, render_sample_data_banner
-from src.data import get_all_teams_list, get_team_details, get_team_conference
+from src.data import get_all_teams_list, get_team_details, get_team_conference, get_value_breakdown, get_last_updated
 
 # Page configuration
 st.set_page_config(
@@ -78,7 +78,7 @@ with st.sidebar:
     st.markdown(
         f"""
         <div style="color: {COLORS['text_muted']}; font-size: 0.6875rem; line-height: 1.5;">
-            <p style="margin-bottom: 0.25rem;">Last updated: Jan 18, 2026</p>
+            <p style="margin-bottom: 0.25rem;">Last updated: {get_last_updated()}</p>
             <p>Data: 247Sports, ESPN, On3</p>
         </div>
         """,
@@ -283,7 +283,7 @@ with tab1:
 
             # Expandable details
             with st.expander(f"Value breakdown for {player['name']}", expanded=False):
-                breakdown = player.get("value_breakdown", {})
+                breakdown = get_value_breakdown(player)
                 col_a, col_b = st.columns(2)
 
                 with col_a:
@@ -350,7 +350,7 @@ with tab2:
 
             # Expandable details
             with st.expander(f"Value breakdown for {player['name']}", expanded=False):
-                breakdown = player.get("value_breakdown", {})
+                breakdown = get_value_breakdown(player)
                 col_a, col_b = st.columns(2)
 
                 with col_a:
@@ -8,7 +8,7 @@ import streamlit as st
 import pandas as pd
 
 from src.theme import get_custom_css, COLORS, render_brand_header, render_sample_data_banner
-from src.data import get_all_transfers, get_all_teams_list, CONFERENCES, ALL_POSITIONS
+from src.data import summarize_transfers, get_transfer_page, get_all_teams_list, CONFERENCES, ALL_POSITIONS
 
 # Page configuration
 st.set_page_config(
@@ -23,17 +23,6 @@ st.markdown(get_custom_css(), unsafe_allow_html=True)
 # Brand header
 st.markdown(render_brand_header(), unsafe_allow_html=True)
 
-
-@st.cache_data
-def load_transfer_data():
-    """Load and cache transfer data."""
-    return get_all_transfers()
-
-
-# Get all transfers
-with st.spinner("Loading transfer data..."):
-    df = load_transfer_data()
-
 # Navigation
 with st.sidebar:
     st.markdown(f"""
@@ -113,42 +102,20 @@ st.markdown('<p class="sub-header">Complete database of all transfer portal move
 # Sample data notice
 st.markdown(render_sample_data_banner(), unsafe_allow_html=True)
 
-# Apply filters
-filtered_df = df.copy()
-
-if search_query:
-    search_lower = search_query.lower()
-    filtered_df = filtered_df[
-        filtered_df["Player"].str.lower().str.contains(search_lower, na=False) |
-        filtered_df["From"].str.lower().str.contains(search_lower, na=False) |
-        filtered_df["To"].str.lower().str.contains(search_lower, na=False) |
-        filtered_df["Position"].str.lower().str.contains(search_lower, na=False)
-    ]
+# Compile filters (applied by src.data, in SQL when the SQLite store is enabled)
+filters = {
+    "search": search_query or None,
+    "conference": selected_conference if selected_conference != "All Conferences" else None,
+    "position": selected_position if selected_position != "All Positions" else None,
+    "team": selected_team if selected_team != "All Teams" else None,
+    "type": {"Incoming": "Inflow", "Outgoing": "Outflow"}.get(transfer_type),
+    "player_class": selected_class if selected_class != "All Classes" else None,
+    "min_rating": min_rating,
+    "max_rating": max_rating,
+}
 
-if selected_conference != "All Conferences":
-    filtered_df = filtered_df[filtered_df["Conference"] == selected_conference]
-
-if selected_position != "All Positions":
-    filtered_df = filtered_df[filtered_df["Position"] == selected_position]
-
-if selected_team != "All Teams":
-    filtered_df = filtered_df[
-        (filtered_df["From"] == selected_team) |
-        (filtered_df["To"] == selected_team)
-    ]
-
-if transfer_type == "Incoming":
-    filtered_df = filtered_df[filtered_df["Type"] == "Inflow"]
-elif transfer_type == "Outgoing":
-    filtered_df = filtered_df[filtered_df["Type"] == "Outflow"]
-
-if selected_class != "All Classes":
-    filtered_df = filtered_df[filtered_df["Class"] == selected_class]
-
-filtered_df = filtered_df[
-    (filtered_df["Rating"] >= min_rating) &
-    (filtered_df["Rating"] <= max_rating)
-]
+with st.spinner("Loading transfer data..."):
+    summary = summarize_transfers(filters)
 
 # Stats summary
 col1, col2, col3, col4 = st.columns(4, gap="medium")
@@ -156,13 +123,13 @@ col1, col2, col3, col4 = st.columns(4, gap="medium")
 with col1:
     st.markdown(f"""
         <div class="metric-card">
-            <p class="metric-value">{len(filtered_df):,}</p>
+            <p class="metric-value">{summary["count"]:,}</p>
             <p class="metric-label">Total Transfers</p>
         </div>
     """, unsafe_allow_html=True)
 
 with col2:
-    total_value = filtered_df["Value ($M)"].sum()
+    total_value = summary["total_value"]
     st.markdown(f"""
         <div class="metric-card success">
             <p class="metric-value">${total_value:.1f}M</p>
@@ -171,7 +138,7 @@ with col2:
     """, unsafe_allow_html=True)
 
 with col3:
-    avg_score = filtered_df["Score"].mean() if len(filtered_df) > 0 else 0
+    avg_score = summary["avg_score"]
     st.markdown(f"""
         <div class="metric-card warning">
             <p class="metric-value">{avg_score:.1f}</p>
@@ -180,7 +147,7 @@ with col3:
     """, unsafe_allow_html=True)
 
 with col4:
-    avg_rating = filtered_df["Rating"].mean() if len(filtered_df) > 0 else 0
+    avg_rating = summary["avg_rating"]
     st.markdown(f"""
         <div class="metric-card info">
             <p class="metric-value">{avg_rating:.4f}</p>
@@ -195,7 +162,7 @@ control_col1, control_col2, control_col3 = st.columns([2, 1, 1])
 
 with control_col1:
     # Row display options
-    rows_per_page_options = {"Show 25": 25, "Show 100": 100, "Show All": len(filtered_df) if len(filtered_df) > 0 else 1}
+    rows_per_page_options = {"Show 25": 25, "Show 100": 100, "Show All": summary["count"] if summary["count"] > 0 else 1}
     rows_selection = st.selectbox("Rows per page", list(rows_per_page_options.keys()), index=1, label_visibility="collapsed")
     items_per_page = rows_per_page_options[rows_selection]
 
@@ -215,14 +182,13 @@ with control_col2:
     sort_by = st.selectbox("Sort by", list(sort_columns.keys()), label_visibility="collapsed")
 
 with control_col3:
-    st.markdown(f'<p style="color: {COLORS["text_secondary"]}; font-size: 0.875rem; padding: 0.5rem 0;">Showing {len(filtered_df):,} transfers</p>', unsafe_allow_html=True)
+    st.markdown(f'<p style="color: {COLORS["text_secondary"]}; font-size: 0.875rem; padding: 0.5rem 0;">Showing {summary["count"]:,} transfers</p>', unsafe_allow_html=True)
 
-# Apply sorting
+# Sorting
 sort_col, ascending = sort_columns[sort_by]
-filtered_df = filtered_df.sort_values(sort_col, ascending=ascending)
 
 # Pagination
-total_records = len(filtered_df)
+total_records = summary["count"]
 total_pages = max(1, (total_records - 1) // items_per_page + 1)
 
 if "db_page" not in st.session_state:
@@ -234,7 +200,7 @@ if st.session_state.db_page > total_pages:
 
 start_idx = (st.session_state.db_page - 1) * items_per_page
 end_idx = min(start_idx + items_per_page, total_records)
-page_df = filtered_df.iloc[start_idx:end_idx]
+page_df = get_transfer_page(filters, sort_col, ascending, limit=items_per_page, offset=start_idx)
 
 # Display showing info
 st.markdown(f'<p style="color: {COLORS["text_muted"]}; font-size: 0.8125rem; margin-bottom: 0.5rem;">Showing {start_idx + 1}-{end_idx} of {total_records:,} transfers</p>', unsafe_allow_html=True)
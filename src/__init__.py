@@ -11,5 +11,5 @@ Modules:
 
 from .theme import get_custom_css, COLORS
 from .data import get_team_data, get_team_details, get_all_teams_list
-from .valuation import calculate_player_value
+from .valuation import calculate_player_value, calculate_player_values
 from .news_feed import get_latest_news
@@ -0,0 +1,280 @@
+"""
+Resumable Multi-Season Backfill for the Transfer Portal Scraper
+
+Scrapes every source for a range of seasons, one page at a time. Each
+finished (source, season, page) unit is written to its own Parquet file
+and then recorded in a checkpoint, so an interrupted or partly failed run
+picks up where it stopped: rerunning the same command skips every
+checkpointed page and retries only what is missing.
+
+Usage:
+    python -m src.backfill --start 2021 --end 2025
+    python -m src.backfill --start 2021 --end 2025 --sources transfers,passing --max-pages 10
+
+Layout under the output directory:
+    checkpoint.json                         finished units and exhausted sources
+    <source>/season=<year>/page-<NNN>.parquet   rows scraped from one page
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.fetch import is_not_found
+from src.parsers import parse_247_transfer_page, parse_espn_page, parse_recruit_page
+from src.scraper import (
+    ESPN_STAT_TYPES,
+    PARSER_VERSION,
+    TransferPortalScraper,
+    espn_stats_url,
+    recruit_rankings_url,
+    transfer_portal_url,
+)
+from src.snapshot import DATA_DIR
+from src.teams import canonicalize_teams
+
+BACKFILL_DIR = DATA_DIR / "backfill"
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+def _paged_source(url_fn: Callable[[int, int], str], parser: str, parse_fn: Callable, team_column: str) -> Dict:
+    return {"url": url_fn, "parser": parser, "parse_fn": parse_fn, "args": lambda year: (), "team_column": team_column}
+
+
+def _espn_source(stat_type: str) -> Dict:
+    return {
+        "url": lambda year, page: espn_stats_url(year, stat_type, page),
+        "parser": f"espn-{stat_type}",
+        "parse_fn": parse_espn_page,
+        "args": lambda year: (stat_type, year),
+        "team_column": "team",
+    }
+
+
+# How to fetch and parse each source (source name -> page plan)
+SOURCES = {
+    "transfers": _paged_source(transfer_portal_url, "247-transfers", parse_247_transfer_page, "destination"),
+    "recruits": _paged_source(recruit_rankings_url, "247-recruits", parse_recruit_page, "committed_to"),
+    **{stat_type: _espn_source(stat_type) for stat_type in ESPN_STAT_TYPES},
+}
+
+
+def _unit_key(source: str, year: int, page: int) -> str:
+    return f"{source}/{year}/{page}"
+
+
+class BackfillCheckpoint:
+    """Thread-safe record of finished pages, persisted after every change."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        self.done = set(data.get("done", []))
+        # (source, season) listings that ran out of rows, as "source/year" -> last page
+        self.exhausted: Dict[str, int] = data.get("exhausted", {})
+
+    def is_done(self, source: str, year: int, page: int) -> bool:
+        exhausted_at = self.exhausted.get(f"{source}/{year}")
+        return _unit_key(source, year, page) in self.done or (exhausted_at is not None and page > exhausted_at)
+
+    def mark_done(self, source: str, year: int, page: int, exhausted: bool = False) -> None:
+        with self._lock:
+            self.done.add(_unit_key(source, year, page))
+            if exhausted:
+                self.exhausted[f"{source}/{year}"] = page
+            self._save()
+
+    def _save(self) -> None:
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"done": sorted(self.done), "exhausted": self.exhausted}, indent=1))
+        os.replace(tmp_path, self.path)
+
+
+def partition_path(out_dir: Path, source: str, year: int, page: int) -> Path:
+    """Parquet file holding one page's rows."""
+    return out_dir / source / f"season={year}" / f"page-{page:03d}.parquet"
+
+
+def _write_partition(path: Path, rows: List[Dict], year: int, team_column: str) -> None:
+    """
+    Write a page's rows via a temp file and rename.
+
+    Rows are tagged with their season and their team column is
+    canonicalized (see teams.canonicalize_teams), as scraped frames are.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frame = canonicalize_teams(pd.DataFrame(rows).assign(season=year), team_column)
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def backfill_source(
+    scraper: TransferPortalScraper,
+    checkpoint: BackfillCheckpoint,
+    out_dir: Path,
+    source: str,
+    year: int,
+    max_pages: int,
+) -> Tuple[int, int]:
+    """
+    Scrape the unfinished pages of one source and season.
+
+    A page with no rows (or a 404) marks the listing as exhausted. Any
+    other failure stops this source/season; it and later pages stay
+    pending for the next run.
+
+    Returns:
+        (pages written, pages still pending)
+    """
+    plan = SOURCES[source]
+    pages = range(1, max_pages + 1)
+    pending = [page for page in pages if not checkpoint.is_done(source, year, page)]
+    if not pending:
+        return 0, 0
+
+    urls = [plan["url"](year, page) for page in pending]
+    parser = f"{plan['parser']}-{year}-v{PARSER_VERSION}"
+    results = scraper.pipeline.run(urls, parser, plan["parse_fn"], *plan["args"](year))
+
+    written = 0
+    for page, (url, rows) in zip(pending, results):
+        if is_not_found(rows):
+            checkpoint.mark_done(source, year, page, exhausted=True)
+            break
+        if isinstance(rows, Exception):
+            print(f"{source} {year} page {page}: {rows}")
+            break
+        if rows:
+            _write_partition(partition_path(out_dir, source, year, page), rows, year, plan["team_column"])
+        checkpoint.mark_done(source, year, page, exhausted=not rows)
+        written += 1
+        if not rows:
+            break
+
+    remaining = sum(not checkpoint.is_done(source, year, page) for page in pages)
+    return written, remaining
+
+
+def run_backfill(
+    years: Iterable[int],
+    sources: Optional[List[str]] = None,
+    max_pages: int = 5,
+    out_dir=BACKFILL_DIR,
+    scraper: Optional[TransferPortalScraper] = None,
+    max_workers: int = 4,
+) -> int:
+    """
+    Backfill every (source, season), resuming from the output directory's checkpoint.
+
+    Sources and seasons run concurrently; the scraper's per-host rate limits
+    keep each site polite.
+
+    Args:
+        years: Seasons to backfill
+        sources: Source names from SOURCES (None = all)
+        max_pages: Pages per source and season
+        out_dir: Directory for partitions and the checkpoint
+        scraper: Preconfigured scraper (e.g. with a cache or replay URL)
+        max_workers: (source, season) units scraped at once
+
+    Returns:
+        Number of pages still pending (0 = backfill complete)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint = BackfillCheckpoint(out_dir / CHECKPOINT_FILE)
+    owns_scraper = scraper is None
+    scraper = scraper or TransferPortalScraper()
+    units = [(source, year) for year in years for source in (sources or list(SOURCES))]
+
+    pending = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                unit: executor.submit(backfill_source, scraper, checkpoint, out_dir, *unit, max_pages)
+                for unit in units
+            }
+            for (source, year), future in futures.items():
+                try:
+                    written, remaining = future.result()
+                except Exception as e:
+                    print(f"{source} {year}: {e}")
+                    written, remaining = 0, 1
+                pending += remaining
+                if written or remaining:
+                    print(f"{source} {year}: {written} pages written, {remaining} pending")
+    finally:
+        if owns_scraper:
+            scraper.close()
+    return pending
+
+
+def load_backfill(source: str, years: Optional[Iterable[int]] = None, out_dir=BACKFILL_DIR) -> pd.DataFrame:
+    """
+    Read a source's backfilled rows, in season and page order.
+
+    The team ID column is re-derived from the canonical team names, since
+    IDs of schools not in teams.TEAMS are only stable within one process.
+
+    Args:
+        source: Source name from SOURCES
+        years: Seasons to read (None = every backfilled season)
+        out_dir: Backfill output directory
+    """
+    source_dir = Path(out_dir) / source
+    if years is None:
+        files = sorted(source_dir.glob("season=*/page-*.parquet"))
+    else:
+        files = [path for year in sorted(years) for path in sorted((source_dir / f"season={year}").glob("page-*.parquet"))]
+    if not files:
+        return pd.DataFrame()
+    frame = pd.concat([pq.read_table(path).to_pandas() for path in files], ignore_index=True)
+    return canonicalize_teams(frame, SOURCES[source]["team_column"])
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Backfill scraper data for a range of seasons.")
+    parser.add_argument("--start", type=int, required=True, help="First season")
+    parser.add_argument("--end", type=int, required=True, help="Last season (inclusive)")
+    parser.add_argument("--sources", default=",".join(SOURCES),
+                        help=f"Comma-separated sources (default: all of {', '.join(SOURCES)})")
+    parser.add_argument("--max-pages", type=int, default=5)
+    parser.add_argument("--out", default=str(BACKFILL_DIR))
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--replay-url", default=None)
+    parser.add_argument("--parse-workers", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sources = [source.strip() for source in args.sources.split(",") if source.strip()]
+    unknown = [source for source in sources if source not in SOURCES]
+    if unknown:
+        parser.error(f"unknown sources: {', '.join(unknown)}")
+
+    scraper = TransferPortalScraper(cache_dir=args.cache_dir, replay_url=args.replay_url,
+                                    parse_workers=args.parse_workers)
+    pending = run_backfill(range(args.start, args.end + 1), sources, args.max_pages, args.out, scraper=scraper)
+    scraper.close()
+
+    if pending:
+        print(f"{pending} pages pending - rerun the same command to resume")
+        sys.exit(1)
+    print("Backfill complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Change Data Capture for Scraped Transfer Portal Rows
+
+Each scraped portal row is reduced to a fingerprint of the fields that
+matter (name, position, status, rating, destination). A tracker keeps
+the last fingerprinted rows per source and season and diffs every new
+scrape against them in one pass over the rows, emitting typed change
+events:
+
+    new_entry      a player appears in the portal
+    committed      a player's status becomes Committed/Enrolled
+    flipped        a committed player's destination changes
+    withdrawn      a player withdraws from the portal
+    rating_change  a player's rating moves
+
+Events are appended to a change log that feeds the Live Feed. The first
+scrape of a source and season only seeds the stored rows: with nothing
+to compare against, every row would otherwise be reported as new.
+
+Layout under the changes directory:
+    state/<source>-<year>.json    last seen rows, keyed by player
+    changes.jsonl                 every emitted change, oldest first
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.http_cache import atomic_write
+from src.snapshot import DATA_DIR
+
+# Change event types
+CHANGE_NEW_ENTRY = "new_entry"
+CHANGE_COMMITTED = "committed"
+CHANGE_FLIPPED = "flipped"
+CHANGE_WITHDRAWN = "withdrawn"
+CHANGE_RATING = "rating_change"
+
+CHANGE_TYPES = [CHANGE_NEW_ENTRY, CHANGE_COMMITTED, CHANGE_FLIPPED, CHANGE_WITHDRAWN, CHANGE_RATING]
+
+# Row fields that make up a fingerprint; anything else is ignored
+FINGERPRINT_FIELDS = ("name", "position", "status", "rating", "destination")
+
+CHANGES_DIR = DATA_DIR / "changes"
+CHANGE_LOG_FILE = "changes.jsonl"
+
+# Bytes read per step when scanning the change log backwards
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def change_fingerprint(row: Dict) -> str:
+    """Stable hash of a row's fingerprint fields."""
+    payload = "\x1f".join("" if row.get(field) is None else str(row.get(field)) for field in FINGERPRINT_FIELDS)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def row_key(row: Dict) -> str:
+    """Identity of a player across scrapes: normalized name plus position."""
+    name = " ".join(str(row.get("name") or "").lower().split())
+    return f"{name}|{row.get('position') or ''}"
+
+
+def _is_committed(status: Optional[str]) -> bool:
+    status = (status or "").lower()
+    return "committed" in status or "enrolled" in status
+
+
+def _is_withdrawn(status: Optional[str]) -> bool:
+    return "withdr" in (status or "").lower()
+
+
+def _snapshot_row(row: Dict) -> Dict:
+    """The fingerprint fields of a row plus its fingerprint."""
+    # Rows from DataFrames carry NaN for missing values; NaN != NaN would
+    # look like a change on every scrape
+    kept = {field: None if row.get(field) != row.get(field) else row.get(field) for field in FINGERPRINT_FIELDS}
+    kept["fingerprint"] = change_fingerprint(kept)
+    return kept
+
+
+def _change(change_type: str, row: Dict, **extra) -> Dict:
+    return {"type": change_type, **{field: row.get(field) for field in FINGERPRINT_FIELDS}, **extra}
+
+
+def diff_rows(previous: Dict[str, Dict], rows: Iterable[Dict]) -> Tuple[List[Dict], Dict[str, Dict]]:
+    """
+    Compare a scrape against the previously seen rows.
+
+    Rows absent from the scrape are kept as they were (an incremental or
+    partial scrape is not a removal), so the diff is a single pass over
+    the new rows with one dict lookup each.
+
+    Args:
+        previous: Rows from the last scrape, keyed by row_key (as returned here)
+        rows: Newly scraped rows
+
+    Returns:
+        (change events in row order, updated rows keyed by row_key)
+    """
+    current = dict(previous)
+    changes = []
+
+    for row in rows:
+        if not row.get("name"):
+            continue
+        key = row_key(row)
+        new = _snapshot_row(row)
+        old = current.get(key)
+        current[key] = new
+
+        if old is None:
+            changes.append(_change(CHANGE_NEW_ENTRY, new))
+            if _is_committed(new["status"]):
+                changes.append(_change(CHANGE_COMMITTED, new))
+            continue
+        if old["fingerprint"] == new["fingerprint"]:
+            continue
+
+        if _is_committed(new["status"]):
+            if not _is_committed(old["status"]):
+                changes.append(_change(CHANGE_COMMITTED, new))
+            elif new["destination"] != old["destination"]:
+                changes.append(_change(CHANGE_FLIPPED, new, previous_destination=old["destination"]))
+        elif _is_withdrawn(new["status"]) and not _is_withdrawn(old["status"]):
+            changes.append(_change(CHANGE_WITHDRAWN, new, previous_destination=old["destination"]))
+
+        if new["rating"] != old["rating"]:
+            changes.append(_change(CHANGE_RATING, new, previous_rating=old["rating"]))
+
+    return changes, current
+
+
+class ChangeTracker:
+    """Per-source, per-season last-seen rows plus an append-only change log."""
+
+    def __init__(self, directory=CHANGES_DIR):
+        self.directory = Path(directory)
+        self.log_path = self.directory / CHANGE_LOG_FILE
+
+    def _state_path(self, source: str, year: int) -> Path:
+        return self.directory / "state" / f"{source}-{year}.json"
+
+    def load(self, source: str, year: int) -> Dict[str, Dict]:
+        """Get the last seen rows for a source and season, keyed by row_key."""
+        try:
+            return json.loads(self._state_path(source, year).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def update(self, source: str, year: int, rows: Iterable[Dict]) -> List[Dict]:
+        """
+        Diff a scrape against the stored rows, persist the result and log the changes.
+
+        Without stored rows (the first scrape of a source and season) the
+        rows are stored and nothing is reported.
+
+        Returns:
+            The change events, each stamped with source, year and detected_at
+        """
+        previous = self.load(source, year)
+        changes, current = diff_rows(previous, rows)
+        if current == previous:
+            return []
+        if not previous:
+            changes = []
+
+        detected_at = time.time()
+        for change in changes:
+            change.update(source=source, year=year, detected_at=detected_at)
+
+        path = self._state_path(source, year)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(current).encode("utf-8"))
+
+        if changes:
+            with open(self.log_path, "a", encoding="utf-8") as log:
+                for change in changes:
+                    log.write(json.dumps(change) + "\n")
+        return changes
+
+    def recent(self, limit: int = 50) -> List[Dict]:
+        """
+        Get the most recent logged changes, newest first.
+
+        Only the tail of the log is read, so the cost does not grow with
+        the log's age.
+        """
+        try:
+            lines = _tail_lines(self.log_path, limit)
+        except OSError:
+            return []
+
+        changes = []
+        for line in reversed(lines):
+            try:
+                changes.append(json.loads(line))
+            except ValueError:
+                continue
+        return changes
+
+
+def _tail_lines(path: Path, limit: int) -> List[str]:
+    """Last `limit` complete lines of a file, read backwards in blocks."""
+    if limit <= 0:
+        return []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # limit + 1 newlines guarantee `limit` whole lines after the first
+        while position > 0 and data.count(b"\n") <= limit:
+            step = min(TAIL_BLOCK_SIZE, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    if position > 0:
+        # The first line may start mid-record
+        lines = lines[1:]
+    return lines[-limit:]
@@ -7,9 +7,17 @@ Real-time transfer portal data would require integration with 247Sports,
 On3, Rivals, or ESPN APIs which require authentication and licensing.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+import copy
+import hashlib
 import random
+import threading
+import time
+
+# Season the sample data represents
+SEASON = 2026
 
 # Conference mappings
 CONFERENCES = {
@@ -42,18 +50,21 @@ CLASS_PROBABILITIES = {
 
 
 def get_team_conference(team: str) -> str:
-    """Get the conference for a team."""
+    """Get the conference for a team (any spelling in the team registry)."""
+    from src.teams import canonical_team
+
+    canonical = canonical_team(team)
     for conf, teams in CONFERENCES.items():
-        if team in teams:
+        if team in teams or canonical in teams:
             return conf
     return "Other"
 
 
-def get_random_class() -> str:
+def get_random_class(rng: random.Random = random) -> str:
     """Get a weighted random player class."""
     classes = list(CLASS_PROBABILITIES.keys())
     weights = list(CLASS_PROBABILITIES.values())
-    return random.choices(classes, weights=weights, k=1)[0]
+    return rng.choices(classes, weights=weights, k=1)[0]
 
 
 # Positions with offensive/defensive categorization
@@ -70,84 +81,552 @@ LAST_NAMES = ["Williams", "Johnson", "Smith", "Brown", "Davis", "Miller", "Wilso
               "Lewis", "Lee", "Walker", "Hall", "Allen", "Young", "King", "Wright", "Scott", "Green"]
 
 
-def generate_player_name():
+def generate_player_name(rng: random.Random = random) -> str:
     """Generate a random player name."""
-    return f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
 
+def get_team_rng(team: str, season: int, is_inflow: bool) -> random.Random:
+    """
+    Get an independent random generator for one team's sample players.
 
-def generate_players_for_team(team: str, count: int, is_inflow: bool) -> List[Dict]:
-    """Generate sample player data for a team with scoring."""
-    players = []
-    random.seed(hash(team) + (1 if is_inflow else 0))
+    The seed is a digest of team, season and direction, so it is stable
+    across processes (unlike hash(), which depends on PYTHONHASHSEED) and
+    never touches the shared module-level generator.
+    """
+    direction = "in" if is_inflow else "out"
+    digest = hashlib.blake2b(f"{team}|{season}|{direction}".encode("utf-8"), digest_size=8).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+
+# Columns of the player store, in order
+PLAYER_COLUMNS = [
+    "team", "direction", "name", "position", "player_class", "hs_rating", "hs_rank",
+    "games_played", "stats_percentile", "value", "score", "other_team", "status", "transfer_date",
+]
+
+# Columns stored as pandas categoricals (few distinct values, many rows)
+CATEGORICAL_COLUMNS = ["team", "direction", "position", "player_class", "other_team", "status"]
+
+
+def generate_players_for_team(team: str, count: int, is_inflow: bool, season: int = SEASON) -> Dict[str, List]:
+    """
+    Generate sample player inputs for one side of a team's portal activity.
+
+    Returns a dict of columns (no valuation); scores and values are added
+    for the whole league at once by build_player_store.
+    """
+    rng = get_team_rng(team, season, is_inflow)
+    other_teams = [t["team"] for t in TOP_25_TEAMS if t["team"] != team]
+    columns = {col: [] for col in PLAYER_COLUMNS if col not in ("value", "score")}
 
     for i in range(count):
         # Generate high school rating (0.8000 - 1.0000 scale)
-        hs_rating = round(random.uniform(0.8200, 0.9900), 4)
+        hs_rating = round(rng.uniform(0.8200, 0.9900), 4)
 
         # Some players have game experience
-        has_game_experience = random.random() > 0.3
-        games_played = random.randint(1, 40) if has_game_experience else 0
+        has_game_experience = rng.random() > 0.3
+        games_played = rng.randint(1, 40) if has_game_experience else 0
 
         # Assign position
-        position = random.choice(ALL_POSITIONS)
+        position = rng.choice(ALL_POSITIONS)
 
         # Assign class
-        player_class = get_random_class()
-
-        # Calculate player value and score
-        from src.valuation import calculate_player_value
-        value_data = calculate_player_value(
-            hs_rating=hs_rating,
-            games_played=games_played,
-            stats_percentile=random.uniform(0.3, 0.95) if has_game_experience else 0,
-            position=position,
-            player_class=player_class
-        )
+        player_class = get_random_class(rng)
+
+        columns["team"].append(team)
+        columns["direction"].append("Inflow" if is_inflow else "Outflow")
+        columns["position"].append(position)
+        columns["player_class"].append(player_class)
+        columns["hs_rating"].append(hs_rating)
+        columns["games_played"].append(games_played)
+        columns["stats_percentile"].append(round(rng.uniform(0.3, 0.95), 2) if has_game_experience else None)
+        columns["name"].append(generate_player_name(rng))
+        columns["hs_rank"].append(rng.randint(1, 500))
+        columns["other_team"].append(rng.choice(other_teams))
+        columns["status"].append(rng.choice(["Committed", "Enrolled"]) if is_inflow else "Entered Portal")
+        columns["transfer_date"].append(f"Jan {rng.randint(1, 17)}, {season}")
+
+    return columns
+
+
+def build_player_store(team_bases: List[Dict], season: int = SEASON, stats: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Build the columnar player store for the whole league.
+
+    One row per player, grouped by team then direction, with categorical
+    dtypes for the low-cardinality columns. Scores and values come from a
+    single calculate_player_values pass; breakdowns are not stored (see
+    get_value_breakdown).
+
+    Args:
+        team_bases: Team rows with inflow/outflow counts
+        season: Season the players belong to
+        stats: Optional wide ESPN stats frame (scraper.espn_stats_wide);
+            players found in its season - 1 rows (by name and previous
+            team) are valued on position-aware stats percentiles (see
+            percentiles.stats_percentile_column)
+    """
+    from src.valuation import calculate_player_values
+
+    columns = {col: [] for col in PLAYER_COLUMNS if col not in ("value", "score")}
+    for team_base in team_bases:
+        for is_inflow, count in ((True, team_base["inflows"]), (False, team_base["outflows"])):
+            team_columns = generate_players_for_team(team_base["team"], count, is_inflow, season)
+            for col, values in team_columns.items():
+                columns[col].extend(values)
+
+    players = pd.DataFrame(columns)
+    if stats is not None and not stats.empty:
+        from src.percentiles import stats_percentile_column
+
+        # Stats are from the season before the one the players transfer into
+        players["stats_percentile"] = stats_percentile_column(players, stats, season=season - 1)
+
+    values = calculate_player_values(
+        hs_rating=players["hs_rating"].to_numpy(),
+        games_played=players["games_played"].to_numpy(),
+        stats_percentile=players["stats_percentile"].to_numpy(dtype=float),
+        position=players["position"].to_numpy(),
+        player_class=players["player_class"].to_numpy(),
+    )
+    players["value"] = values["value"]
+    players["score"] = values["score"]
 
-        player = {
-            "name": generate_player_name(),
-            "position": position,
-            "player_class": player_class,
-            "hs_rating": hs_rating,
-            "hs_rank": random.randint(1, 500),
-            "games_played": games_played,
-            "stats_percentile": round(random.uniform(0.3, 0.95), 2) if has_game_experience else None,
-            "value": value_data["value"],
-            "score": value_data["score"],
-            "value_breakdown": value_data["breakdown"],
-            "previous_team" if is_inflow else "new_team": random.choice([t["team"] for t in TOP_25_TEAMS if t["team"] != team]),
-            "status": random.choice(["Committed", "Enrolled"]) if is_inflow else "Entered Portal",
-            "transfer_date": f"Jan {random.randint(1, 17)}, 2026"
+    for col in CATEGORICAL_COLUMNS:
+        players[col] = players[col].astype("category")
+    players["hs_rank"] = players["hs_rank"].astype("int16")
+    players["games_played"] = players["games_played"].astype("int16")
+
+    return players[PLAYER_COLUMNS]
+
+
+def get_value_breakdown(player: Dict) -> Dict:
+    """
+    Derive the value breakdown for a single player row on demand.
+
+    Breakdowns are cheap to recompute from the stored inputs, so the
+    player store keeps only the inputs plus the final score and value.
+    """
+    from src.valuation import calculate_player_value
+
+    return calculate_player_value(
+        hs_rating=player["hs_rating"],
+        games_played=int(player["games_played"]),
+        stats_percentile=player.get("stats_percentile"),
+        position=player["position"],
+        player_class=player["player_class"],
+    )["breakdown"]
+
+
+def _team_score_data(players: pd.DataFrame) -> Dict[str, Dict]:
+    """Aggregate calculate_team_score fields for every team in one grouped pass."""
+    offensive = players["position"].isin(OFFENSIVE_POSITIONS)
+    defensive = players["position"].isin(DEFENSIVE_POSITIONS)
+    grouped = players.assign(offensive=offensive, defensive=defensive).groupby(
+        ["team", "direction"], observed=False
+    ).agg(score=("score", "sum"), value=("value", "sum"), offensive=("offensive", "sum"), defensive=("defensive", "sum"))
+
+    score_by_team = {}
+    for team in players["team"].cat.categories:
+        inflow = grouped.loc[(team, "Inflow")]
+        outflow = grouped.loc[(team, "Outflow")]
+        off_in, off_out = int(inflow["offensive"]), int(outflow["offensive"])
+        def_in, def_out = int(inflow["defensive"]), int(outflow["defensive"])
+        score_by_team[team] = {
+            "total_score": round(inflow["score"] - outflow["score"], 2),
+            "incoming_score": round(inflow["score"], 2),
+            "outgoing_score": round(outflow["score"], 2),
+            "offensive_net": off_in - off_out,
+            "offensive_in": off_in,
+            "offensive_out": off_out,
+            "defensive_net": def_in - def_out,
+            "defensive_in": def_in,
+            "defensive_out": def_out,
+            "nil_spent": round(inflow["value"], 2),
         }
-        players.append(player)
+    return score_by_team
 
-    return players
 
+class LeagueSnapshot:
+    """
+    League-wide transfer data computed in a single pass.
 
-def calculate_team_data_with_scores() -> List[Dict]:
-    """Calculate team data with proper scoring system."""
-    teams_with_scores = []
+    Holds the columnar player store plus every team's scores, rank and
+    conference so per-team lookups are dictionary reads instead of
+    regenerating the league. Snapshots published by the refresh worker
+    also carry the scraped portal rankings (scraper.calculate_team_rankings).
 
-    for team_base in TOP_25_TEAMS:
-        team_name = team_base["team"]
+    Transfer events (see with_event) do not copy the player store: a
+    snapshot shares its stored rows with the one it was derived from and
+    keeps the players events removed and added as a small overlay. Player
+    row IDs are positions in the stored rows, then len(stored rows) on
+    for added players, in the order events added them.
+    """
+
+    def __init__(
+        self,
+        teams: List[Dict],
+        players: pd.DataFrame,
+        portal_rankings: Optional[pd.DataFrame] = None,
+        ranking: Optional["TeamRanking"] = None,
+    ):
+        from src.ranking import TeamRanking
+
+        self.teams = teams
+        self.portal_rankings = portal_rankings
+        # Set when loaded from a published version (see load_league_snapshot)
+        self.version: Optional[str] = None
+        self.published_at: Optional[float] = None
+        # Whether the players are generated sample data rather than scraped
+        self.sample_data = True
+        # Event log entries reflected in this snapshot (see events.EventLog)
+        self.events_applied = 0
+        # Per applied event that changed players: (removed row IDs, added (row ID, row) pairs)
+        self.row_changes: Tuple[Tuple[Tuple[int, ...], Tuple[Tuple[int, Dict], ...]], ...] = ()
+        self.ranking = ranking if ranking is not None else TeamRanking(teams)
+        self._teams_by_name = {t["team"]: t for t in teams}
+        self._stored_players = players
+        self._player_rows = players.groupby(["team", "direction"], observed=True).indices
+        self._removed: FrozenSet[int] = frozenset()
+        self._added: Dict[int, Dict] = {}
+        self._next_row_id = len(players)
+        self._stored_transfers_df = None
+        self._stored_key = None
+        self._reset_caches()
+
+    def _reset_caches(self) -> None:
+        self._players = None
+        self._team_df = None
+        self._transfers_df = None
+        self._summary_stats = None
+        self._content_key = None
+
+    @property
+    def players(self) -> pd.DataFrame:
+        """The player store, with the players events added and removed."""
+        if not self._removed and not self._added:
+            return self._stored_players
+        if self._players is None:
+            kept = np.setdiff1d(np.arange(len(self._stored_players)), list(self._removed))
+            self._players = _append_player_rows(self._stored_players.iloc[kept].reset_index(drop=True),
+                                                list(self._added.values()))
+        return self._players
+
+    def get_team(self, team_name: str) -> Optional[Dict]:
+        """Get the scored team row (rank, score, NIL spent, etc.)."""
+        return self._teams_by_name.get(team_name)
+
+    def _stored_rows(self, team_name: str, direction: str) -> List[int]:
+        rows = self._player_rows.get((team_name, direction), ())
+        return [row for row in rows if row not in self._removed] if self._removed else list(rows)
+
+    def _added_rows(self, team_name: str, direction: str) -> List[Tuple[int, Dict]]:
+        return [(row_id, row) for row_id, row in self._added.items()
+                if row["team"] == team_name and row["direction"] == direction]
+
+    def get_players(self, team_name: str, direction: str) -> pd.DataFrame:
+        """Get the player store rows for one team and direction ("Inflow"/"Outflow")."""
+        rows = self._stored_rows(team_name, direction)
+        added = self._added_rows(team_name, direction)
+        players = self._stored_players.iloc[rows]
+        if added:
+            players = _append_player_rows(players, [row for _, row in added])
+        return players
+
+    def get_inflows(self, team_name: str) -> List[Dict]:
+        """Get the players a team gained."""
+        return _player_records(self.get_players(team_name, "Inflow"), "previous_team")
+
+    def get_outflows(self, team_name: str) -> List[Dict]:
+        """Get the players a team lost."""
+        return _player_records(self.get_players(team_name, "Outflow"), "new_team")
+
+    def get_score_data(self, team_name: str) -> Dict:
+        """Get the calculate_team_score output for a team."""
+        from src.ranking import score_data_from_team
+
+        team = self.get_team(team_name)
+        return score_data_from_team(team) if team else {}
+
+    def _find_player(self, team_name: str, direction: str, player: Dict, skip: Set[int]) -> Optional[int]:
+        """
+        Row ID of the player an event removes from one side of a team.
+
+        Matched by name when the event gives one, otherwise the player at the
+        event's position whose score is closest to the event's. None when the
+        team has no such player. Only that team's rows are looked at.
+        """
+        candidates = []
+        rows = [row for row in self._stored_rows(team_name, direction) if row not in skip]
+        if rows:
+            stored = self._stored_players.iloc[rows]
+            keep = np.ones(len(rows), dtype=bool)
+            if player.get("position"):
+                keep &= (stored["position"] == player["position"]).to_numpy()
+            if player.get("name"):
+                keep &= (stored["name"] == player["name"]).to_numpy()
+            candidates.extend(zip(np.asarray(rows)[keep].tolist(), stored["score"].to_numpy()[keep].tolist()))
+        for row_id, row in self._added_rows(team_name, direction):
+            if row_id in skip or any(player.get(key) and row[key] != player[key] for key in ("position", "name")):
+                continue
+            candidates.append((row_id, row["score"]))
+
+        if not candidates:
+            return None
+        target = player.get("score", 0.0)
+        return min(candidates, key=lambda candidate: abs(candidate[1] - target))[0]
+
+    def _player_row(self, row_id: int) -> Dict:
+        if row_id in self._added:
+            return self._added[row_id]
+        return self._stored_players.iloc[row_id].to_dict()
+
+    def with_event(self, event: Dict) -> Tuple["LeagueSnapshot", List[str]]:
+        """
+        Apply one transfer event (see ranking.event_changes) to a copy.
+
+        This snapshot is left untouched, so readers still holding it keep a
+        consistent view. Each removal is resolved against the team's own
+        rows first; the team then loses that player's score, value and
+        position, and a removal that matches no player changes nothing.
+        Added players come from the event's player (for a flip, on top of
+        the row it moved from).
+
+        The copy shares the stored player rows and every team row the event
+        leaves alone: only the affected teams' rows and those whose rank
+        moved are copied, and the affected teams are re-ranked in O(log n)
+        comparisons.
+
+        Returns:
+            (the new snapshot, names of the teams whose rows changed); the
+            new snapshot counts the event in events_applied either way
+
+        Raises:
+            ValueError: If the event type is unknown
+        """
+        from src.ranking import apply_team_changes, event_changes
+
+        removed: Set[int] = set()
+        added: List[Tuple[int, Dict]] = []
+        team_changes = []
+        moved = None  # Row a flip takes the player from, reused for the team they move to
+        for team_name, is_inflow, sign in event_changes(event):
+            if team_name not in self._teams_by_name:
+                continue
+            if sign > 0:
+                row = _event_player_row(event, team_name, is_inflow, moved)
+                added.append((self._next_row_id + len(added), row))
+            else:
+                row_id = self._find_player(team_name, "Inflow" if is_inflow else "Outflow", event["player"], removed)
+                if row_id is None:
+                    continue
+                removed.add(row_id)
+                row = moved = self._player_row(row_id)
+            team_changes.append((team_name, is_inflow, sign, row))
+
+        snapshot = copy.copy(self)
+        snapshot.events_applied = self.events_applied + 1
+        if not team_changes:
+            return snapshot, []
+
+        copies = {name: dict(self._teams_by_name[name]) for name, _, _, _ in team_changes}
+        affected = apply_team_changes(copies, team_changes)
+
+        ranking = self.ranking.copy()
+        teams = list(self.teams)
+        first, last = len(teams), 0
+        for team_name in affected:
+            old_index, new_index = ranking.update(copies[team_name])
+            teams.pop(old_index)
+            teams.insert(new_index, copies[team_name])
+            first, last = min(first, old_index, new_index), max(last, old_index, new_index)
+        for i in range(first, last + 1):
+            if teams[i]["rank"] != i + 1:
+                if teams[i]["team"] not in copies:
+                    teams[i] = copies[teams[i]["team"]] = dict(teams[i])
+                teams[i]["rank"] = i + 1
+
+        snapshot.teams = teams
+        snapshot.ranking = ranking
+        snapshot._teams_by_name = {**self._teams_by_name, **copies}
+        stored_removed = {row_id for row_id in removed if row_id not in self._added}
+        snapshot._removed = self._removed | stored_removed if stored_removed else self._removed
+        snapshot._added = {row_id: row for row_id, row in self._added.items() if row_id not in removed}
+        snapshot._added.update(added)
+        snapshot._next_row_id = self._next_row_id + len(added)
+        snapshot.row_changes = self.row_changes + ((tuple(sorted(removed)), tuple(added)),)
+        snapshot._reset_caches()
+        return snapshot, affected
+
+    @property
+    def team_df(self) -> pd.DataFrame:
+        """Team rows as a DataFrame, sorted by score."""
+        if self._team_df is None:
+            self._team_df = pd.DataFrame(self.teams)
+        return self._team_df
+
+    @property
+    def summary_stats(self) -> Dict:
+        """Dashboard summary statistics."""
+        if self._summary_stats is None:
+            df = self.team_df
+            self._summary_stats = {
+                "total_transfers": int(df["inflows"].sum() + df["outflows"].sum()),
+                "total_inflows": int(df["inflows"].sum()),
+                "total_outflows": int(df["outflows"].sum()),
+                "total_nil_spent": round(df["nil_spent"].sum(), 1),
+                "avg_score": round(df["score"].mean(), 1),
+                "teams_tracked": len(self.teams),
+            }
+        return self._summary_stats
+
+    def _conferences(self) -> Dict[str, str]:
+        return {t["team"]: t["conference"] for t in self.teams}
+
+    @property
+    def stored_transfers_df(self) -> pd.DataFrame:
+        """transfers_df of the stored rows alone (row i is player row ID i)."""
+        if self._stored_transfers_df is None:
+            self._stored_transfers_df = _build_transfers_df(self._stored_players, self._conferences())
+        return self._stored_transfers_df
+
+    @property
+    def stored_key(self) -> str:
+        """Hash of stored_transfers_df; with row_changes it identifies the data across processes."""
+        if self._stored_key is None:
+            self._stored_key = _frame_key(self.stored_transfers_df)
+        return self._stored_key
+
+    @property
+    def transfers_df(self) -> pd.DataFrame:
+        """Every inflow and outflow in the league, one row per transfer."""
+        if not self._removed and not self._added:
+            return self.stored_transfers_df
+        if self._transfers_df is None:
+            self._transfers_df = _build_transfers_df(self.players, self._conferences())
+        return self._transfers_df
+
+    @property
+    def content_key(self) -> str:
+        """
+        Hash of transfers_df, identifying the data rather than this object.
+
+        Equal in every process serving the same rows (see
+        refresh.publish_key).
+        """
+        if not self._removed and not self._added:
+            return self.stored_key
+        if self._content_key is None:
+            self._content_key = _frame_key(self.transfers_df)
+        return self._content_key
+
+    def transfer_changes(self, start: int = 0) -> Tuple[List[int], pd.DataFrame]:
+        """
+        Net transfers_df rows removed and added by row_changes[start:].
+
+        A player added and removed again within the range appears in neither.
+
+        Returns:
+            (removed row IDs, added rows indexed by row ID)
+        """
+        removed: Set[int] = set()
+        added: Dict[int, Dict] = {}
+        for change_removed, change_added in self.row_changes[start:]:
+            for row_id in change_removed:
+                if added.pop(row_id, None) is None:
+                    removed.add(row_id)
+            added.update(change_added)
+
+        transfers = _build_transfers_df(pd.DataFrame(list(added.values()), columns=PLAYER_COLUMNS),
+                                        self._conferences())
+        transfers.index = list(added)
+        return sorted(removed), transfers
+
+
+def _frame_key(df: pd.DataFrame) -> str:
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()
+
+
+def _event_player_row(event: Dict, team_name: str, is_inflow: bool, base: Optional[Dict] = None) -> Dict:
+    """
+    Player store row for the player a transfer event adds to one side of a team.
+
+    Fields come from `base` (the row a flip moved the player from, so the
+    player keeps their stored score and value), then the event's player,
+    then defaults. The default transfer date is the day the event was
+    logged, so every replay builds the same row.
+    """
+    player = {**event["player"], **(base or {})}
+    logged = time.gmtime(event.get("recorded_at"))
+    if is_inflow:
+        other_team = event.get("from_team") or player.get("other_team") or "Unknown"
+    else:
+        other_team = event.get("to_team") or player.get("other_team") or "TBD"
+    return {
+        "team": team_name,
+        "direction": "Inflow" if is_inflow else "Outflow",
+        "name": player.get("name") or "Unknown",
+        "position": player.get("position"),
+        "player_class": player.get("player_class", "Junior"),
+        "hs_rating": player.get("hs_rating", np.nan),
+        "hs_rank": player.get("hs_rank", 0),
+        "games_played": player.get("games_played", 0),
+        "stats_percentile": player.get("stats_percentile", np.nan),
+        "value": player.get("value", 0.0),
+        "score": player.get("score", 0.0),
+        "other_team": other_team,
+        "status": "Committed" if is_inflow else "Entered Portal",
+        "transfer_date": player.get("transfer_date",
+                                    f"{time.strftime('%b', logged)} {logged.tm_mday}, {logged.tm_year}"),
+    }
+
+
+def _append_player_rows(players: pd.DataFrame, rows: List[Dict]) -> pd.DataFrame:
+    """Player store rows followed by new rows, keeping the store's dtypes."""
+    if not rows:
+        return players
+    # New rows may bring categories (e.g. an other_team) the store has not seen
+    combined = pd.concat([players.astype({col: object for col in CATEGORICAL_COLUMNS}),
+                          pd.DataFrame(rows, columns=PLAYER_COLUMNS)], ignore_index=True)
+    for col in CATEGORICAL_COLUMNS:
+        combined[col] = combined[col].astype("category")
+    return combined.astype({"hs_rank": "int16", "games_played": "int16", "stats_percentile": float})
+
+
+def _player_records(rows: pd.DataFrame, other_team_key: str) -> List[Dict]:
+    """Convert player store rows to the per-player dicts the pages render."""
+    records = rows.drop(columns=["team", "direction"]).rename(columns={"other_team": other_team_key}).to_dict("records")
+    for record in records:
+        if pd.isna(record["stats_percentile"]):
+            record["stats_percentile"] = None
+    return records
 
-        # Generate player data
-        inflows = generate_players_for_team(team_name, team_base["inflows"], is_inflow=True)
-        outflows = generate_players_for_team(team_name, team_base["outflows"], is_inflow=False)
 
-        # Calculate scores
-        from src.valuation import calculate_team_score
-        score_data = calculate_team_score(inflows, outflows)
+def build_league_snapshot(stats: Optional[pd.DataFrame] = None) -> LeagueSnapshot:
+    """
+    Generate players and scores for every team once and rank the league.
 
-        # Calculate NIL spent (sum of incoming player values)
-        nil_spent = sum(p["value"] for p in inflows)
+    Args:
+        stats: Optional wide ESPN stats frame to value players on (see build_player_store)
+    """
+    from src.ranking import ranking_key
+
+    players = build_player_store(TOP_25_TEAMS, stats=stats)
+    score_by_team = _team_score_data(players)
+
+    teams_with_scores = []
+    for team_base in TOP_25_TEAMS:
+        team_name = team_base["team"]
+        score_data = score_by_team[team_name]
 
         team_data = {
             "team": team_name,
             "score": score_data["total_score"],
             "incoming_score": score_data["incoming_score"],
             "outgoing_score": score_data["outgoing_score"],
-            "nil_spent": round(nil_spent, 2),
+            "nil_spent": score_data["nil_spent"],
             "inflows": team_base["inflows"],
             "outflows": team_base["outflows"],
             "offensive_in": score_data["offensive_in"],
@@ -162,11 +641,227 @@ def calculate_team_data_with_scores() -> List[Dict]:
         teams_with_scores.append(team_data)
 
     # Sort by score descending and assign ranks
-    teams_with_scores.sort(key=lambda x: x["score"], reverse=True)
+    teams_with_scores.sort(key=ranking_key)
     for i, team in enumerate(teams_with_scores):
         team["rank"] = i + 1
 
-    return teams_with_scores
+    return LeagueSnapshot(teams_with_scores, players)
+
+
+def _load_published(season: int, manifest: Dict) -> LeagueSnapshot:
+    """Load the published version a manifest points at."""
+    from src.snapshot import read_league_snapshot, version_path
+
+    snapshot = read_league_snapshot(version_path(season, manifest["version"]))
+    snapshot.version = manifest["version"]
+    snapshot.published_at = manifest.get("published_at")
+    snapshot.sample_data = manifest.get("sample_data", True)
+    snapshot.events_applied = manifest.get("events_applied", 0)
+    return snapshot
+
+
+def load_league_snapshot(season: int = SEASON) -> LeagueSnapshot:
+    """
+    Load the season's snapshot from disk, building and writing it if missing.
+
+    The version published by the refresh worker (python -m src.refresh)
+    wins. Without one, the local sample-data snapshot is used; a missing,
+    unreadable or outdated snapshot file falls back to an in-process build,
+    and failing to write the new file is not fatal. Nothing here scrapes.
+    """
+    import pyarrow as pa
+    from src.snapshot import league_snapshot_path, read_league_snapshot, read_manifest, write_league_snapshot
+
+    manifest = read_manifest(season)
+    if manifest is not None:
+        try:
+            return _load_published(season, manifest)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            print(f"Could not read published snapshot {manifest['version']}: {e}")
+
+    path = league_snapshot_path(season)
+    if path.exists():
+        try:
+            return read_league_snapshot(path)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            print(f"Rebuilding league snapshot ({path}): {e}")
+
+    snapshot = build_league_snapshot()
+    try:
+        write_league_snapshot(snapshot, path)
+    except OSError as e:
+        print(f"Could not write league snapshot ({path}): {e}")
+    return snapshot
+
+
+# Seconds a loaded sample-data snapshot is served before it is reloaded
+# (published versions are swapped as soon as the manifest changes)
+LEAGUE_CACHE_TTL = 15 * 60
+
+# Seconds between checks of the published manifest for a new version
+MANIFEST_CHECK_INTERVAL = 2.0
+
+# Shown as the last update while the served league is sample data
+SAMPLE_DATA_UPDATED = "Jan 18, 2026"
+
+# Process-wide league cache, shared by every Streamlit session and page
+_league_cache_lock = threading.Lock()
+_league_snapshot: Optional[LeagueSnapshot] = None
+_league_snapshot_built_at = 0.0
+_manifest_checked_at = 0.0
+_manifest_mtime: Optional[int] = None
+# Bytes of the event log reflected in the cached snapshot
+_event_log_offset = 0
+
+
+def replay_event_log(snapshot: LeagueSnapshot, season: int = SEASON) -> Tuple[LeagueSnapshot, int]:
+    """
+    Apply the season's logged transfer events the snapshot does not hold yet.
+
+    Returns:
+        (the snapshot with every logged event, event log offset read up to)
+    """
+    from src.events import EventLog
+
+    events, offset = EventLog(season).read()
+    for event in events[snapshot.events_applied:]:
+        snapshot, _ = snapshot.with_event(event)
+    return snapshot, offset
+
+
+def _apply_logged_events() -> List[Tuple[Dict, List[str]]]:
+    """
+    Apply events logged since the cached snapshot was last caught up (lock held).
+
+    Returns:
+        (event, names of the teams it changed) per applied event
+    """
+    from src.events import EventLog
+
+    global _league_snapshot, _event_log_offset
+    log = EventLog(SEASON)
+    if log.size() <= _event_log_offset:
+        return []
+    events, _event_log_offset = log.read(_event_log_offset)
+    applied = []
+    for event in events:
+        _league_snapshot, affected = _league_snapshot.with_event(event)
+        applied.append((event, affected))
+    return applied
+
+
+def _swap_published_version() -> None:
+    """Swap in the published version if it differs from the cached one (lock held)."""
+    import pyarrow as pa
+    from src.snapshot import manifest_mtime, read_manifest
+
+    global _league_snapshot, _manifest_mtime, _event_log_offset
+    mtime = manifest_mtime(SEASON)
+    if mtime == _manifest_mtime:
+        return
+    manifest = read_manifest(SEASON)
+    if manifest is None or manifest["version"] == _league_snapshot.version:
+        _manifest_mtime = mtime
+        return
+    try:
+        _league_snapshot, _event_log_offset = replay_event_log(_load_published(SEASON, manifest))
+        _manifest_mtime = mtime
+    except (OSError, ValueError, pa.ArrowException) as e:
+        # Keep serving the current version; retried on the next check
+        print(f"Could not swap in published snapshot {manifest['version']}: {e}")
+
+
+def get_league_snapshot() -> LeagueSnapshot:
+    """
+    Get the shared league snapshot, hot-swapping in newly published versions.
+
+    At most every MANIFEST_CHECK_INTERVAL seconds the published manifest is
+    stat()ed; when it changed and names a new version, that version is
+    loaded (a memory map) and replaces the cached snapshot without a
+    restart. Every replica following the same data directory converges on
+    the same version within that interval. Transfer events logged by any
+    process (see apply_transfer_event) are applied on the same schedule,
+    and replayed on top of every loaded or swapped-in version.
+
+    The snapshot lives at module level, so every session in the Streamlit
+    process reads the same object; treat its frames as read-only.
+    """
+    from src.snapshot import manifest_mtime
+
+    global _league_snapshot, _league_snapshot_built_at, _manifest_checked_at, _manifest_mtime, _event_log_offset
+    with _league_cache_lock:
+        now = time.monotonic()
+        expired = _league_snapshot is not None and _league_snapshot.version is None and (
+            now - _league_snapshot_built_at > LEAGUE_CACHE_TTL
+        )
+        if _league_snapshot is None or expired:
+            # Read the mtime first: a publish during the load is picked up by the next check
+            _manifest_mtime = manifest_mtime(SEASON)
+            _league_snapshot, _event_log_offset = replay_event_log(load_league_snapshot())
+            _league_snapshot_built_at = _manifest_checked_at = now
+        elif now - _manifest_checked_at >= MANIFEST_CHECK_INTERVAL:
+            _manifest_checked_at = now
+            _swap_published_version()
+            _apply_logged_events()
+        return _league_snapshot
+
+
+def get_last_updated() -> str:
+    """
+    Sidebar "last updated" text for the snapshot being served.
+
+    A published sample-data league keeps the sample date: only its portal
+    rankings were refreshed, not the players the pages show.
+    """
+    snapshot = get_league_snapshot()
+    if snapshot.published_at is None or snapshot.sample_data:
+        return SAMPLE_DATA_UPDATED
+    return time.strftime("%b %d, %Y %H:%M UTC", time.gmtime(snapshot.published_at))
+
+
+def invalidate_league_cache() -> None:
+    """Drop the shared league snapshot so the next read reloads it."""
+    global _league_snapshot
+    with _league_cache_lock:
+        _league_snapshot = None
+
+
+def apply_transfer_event(event: Dict) -> List[str]:
+    """
+    Log a transfer event and apply it to the shared league snapshot.
+
+    See ranking.apply_transfer_event for the event format; the event's
+    "player" may also carry player store fields (name, player_class,
+    hs_rating, ...) for the team's inflow/outflow list. The event goes
+    to the season's event log (events.EventLog) first, then this process
+    applies everything logged since its last catch-up, in log order, so
+    every process ends up with the same league. The updated snapshot is
+    built aside and swapped in under the cache lock (see
+    LeagueSnapshot.with_event).
+
+    Returns:
+        Names of the teams whose rows changed
+
+    Raises:
+        ValueError: If the event type is unknown
+    """
+    from src.events import EventLog
+
+    get_league_snapshot()
+    logged = EventLog(SEASON).append(event)
+    with _league_cache_lock:
+        if _league_snapshot is None:
+            # Invalidated meanwhile; the next load replays the event
+            return []
+        for applied, affected in _apply_logged_events():
+            if applied["id"] == logged["id"]:
+                return affected
+        return []
+
+
+def calculate_team_data_with_scores() -> List[Dict]:
+    """Calculate team data with proper scoring system."""
+    return build_league_snapshot().teams
 
 
 # Base team data (will be enhanced with scoring)
@@ -201,9 +896,7 @@ TOP_25_TEAMS = [
 
 def get_team_data() -> pd.DataFrame:
     """Get the team data as a DataFrame, sorted by score."""
-    teams_with_scores = calculate_team_data_with_scores()
-    df = pd.DataFrame(teams_with_scores)
-    return df
+    return get_league_snapshot().team_df
 
 
 def get_team_details(team_name: str) -> Dict:
@@ -212,28 +905,24 @@ def get_team_details(team_name: str) -> Dict:
     if not team_base:
         return None
 
-    # Generate player data with scores
-    inflows = generate_players_for_team(team_name, team_base["inflows"], is_inflow=True)
-    outflows = generate_players_for_team(team_name, team_base["outflows"], is_inflow=False)
-
-    # Calculate team scores
-    from src.valuation import calculate_team_score
-    score_data = calculate_team_score(inflows, outflows)
-
-    # Get the rank from scored data
-    all_teams = calculate_team_data_with_scores()
-    team_rank_data = next((t for t in all_teams if t["team"] == team_name), None)
+    snapshot = get_league_snapshot()
+    team_rank_data = snapshot.get_team(team_name)
+    inflows = snapshot.get_inflows(team_name)
+    outflows = snapshot.get_outflows(team_name)
+    score_data = snapshot.get_score_data(team_name)
 
     return {
         "info": {
             **team_base,
             "rank": team_rank_data["rank"] if team_rank_data else team_base["rank"],
+            "inflows": team_rank_data["inflows"],
+            "outflows": team_rank_data["outflows"],
             "score": score_data["total_score"],
-            "nil_spent": round(sum(p["value"] for p in inflows), 2),
+            "nil_spent": team_rank_data["nil_spent"],
             "offensive_net": score_data["offensive_net"],
             "defensive_net": score_data["defensive_net"],
         },
-        "conference": get_team_conference(team_name),
+        "conference": team_rank_data["conference"],
         "inflows": inflows,
         "outflows": outflows,
         "score_data": score_data,
@@ -247,57 +936,125 @@ def get_all_teams_list() -> List[str]:
 
 def get_summary_stats() -> Dict:
     """Get summary statistics for the dashboard."""
-    df = get_team_data()
-    return {
-        "total_transfers": int(df["inflows"].sum() + df["outflows"].sum()),
-        "total_inflows": int(df["inflows"].sum()),
-        "total_outflows": int(df["outflows"].sum()),
-        "total_nil_spent": round(df["nil_spent"].sum(), 1),
-        "avg_score": round(df["score"].mean(), 1),
-        "teams_tracked": len(TOP_25_TEAMS),
-    }
+    return get_league_snapshot().summary_stats
+
+
+def get_portal_rankings() -> Optional[pd.DataFrame]:
+    """Get the scraped portal rankings of the published snapshot (None until one is published)."""
+    rankings = get_league_snapshot().portal_rankings
+    return rankings if rankings is not None and len(rankings) else None
 
 
 def get_all_transfers() -> pd.DataFrame:
     """Get all transfer data from all teams for the database."""
-    all_transfers = []
-    teams = get_all_teams_list()
-
-    for team in teams:
-        team_data = get_team_details(team)
-        if team_data:
-            # Add inflows
-            for player in team_data["inflows"]:
-                all_transfers.append({
-                    "Player": player["name"],
-                    "Position": player["position"],
-                    "Class": player["player_class"],
-                    "From": player.get("previous_team", "Unknown"),
-                    "To": team,
-                    "Rating": player["hs_rating"],
-                    "Score": player["score"],
-                    "Value ($M)": player["value"],
-                    "Games": player["games_played"],
-                    "Date Transferred": player.get("transfer_date", "Jan 2026"),
-                    "Type": "Inflow",
-                    "Conference": team_data["conference"]
-                })
-
-            # Add outflows
-            for player in team_data["outflows"]:
-                all_transfers.append({
-                    "Player": player["name"],
-                    "Position": player["position"],
-                    "Class": player["player_class"],
-                    "From": team,
-                    "To": player.get("new_team", "TBD"),
-                    "Rating": player["hs_rating"],
-                    "Score": player["score"],
-                    "Value ($M)": player["value"],
-                    "Games": player["games_played"],
-                    "Date Transferred": player.get("transfer_date", "Jan 2026"),
-                    "Type": "Outflow",
-                    "Conference": team_data["conference"]
-                })
-
-    return pd.DataFrame(all_transfers)
+    return get_league_snapshot().transfers_df
+
+
+# Serializes rebuilds of the SQLite transfer store within this process
+_transfer_store_lock = threading.Lock()
+
+
+def _sqlite_transfer_store():
+    """
+    Get the SQLite transfer store if configured, in sync with the served snapshot.
+
+    The table is rebuilt when it holds different stored rows than the
+    served snapshot (compared by stored_key, which the database records):
+    a TTL reload or a hot-swapped published version. Transfer events only
+    delete and insert their own rows. Processes sharing the database and
+    serving the same data never rebuild it for each other; one that is
+    behind on events leaves a table that is ahead alone.
+    """
+    from src.transfer_store import get_transfer_store
+
+    store = get_transfer_store()
+    if store is None:
+        return None
+    snapshot = get_league_snapshot()
+    with _transfer_store_lock:
+        key, applied = store.state()
+        if key != snapshot.stored_key:
+            store.build(snapshot.stored_transfers_df, snapshot.stored_key)
+            key, applied = store.state()
+        if key == snapshot.stored_key and applied < len(snapshot.row_changes):
+            removed, added = snapshot.transfer_changes(applied)
+            store.apply_changes(key, applied, len(snapshot.row_changes), removed, added)
+    return store
+
+
+def filter_transfers(df: pd.DataFrame, filters: Dict) -> pd.DataFrame:
+    """Apply Database page filters (see transfer_store.compile_filters) to a transfers frame."""
+    mask = pd.Series(True, index=df.index)
+
+    if filters.get("search"):
+        search_lower = filters["search"].lower()
+        mask &= (
+            df["Player"].str.lower().str.contains(search_lower, na=False, regex=False) |
+            df["From"].str.lower().str.contains(search_lower, na=False, regex=False) |
+            df["To"].str.lower().str.contains(search_lower, na=False, regex=False) |
+            df["Position"].str.lower().str.contains(search_lower, na=False, regex=False)
+        )
+
+    for key, column in (("conference", "Conference"), ("position", "Position"),
+                        ("type", "Type"), ("player_class", "Class")):
+        if filters.get(key) is not None:
+            mask &= df[column] == filters[key]
+
+    if filters.get("team") is not None:
+        mask &= (df["From"] == filters["team"]) | (df["To"] == filters["team"])
+
+    if filters.get("min_rating") is not None:
+        mask &= df["Rating"] >= filters["min_rating"]
+    if filters.get("max_rating") is not None:
+        mask &= df["Rating"] <= filters["max_rating"]
+
+    return df[mask]
+
+
+def summarize_transfers(filters: Dict) -> Dict:
+    """Count and aggregate the transfers matching the Database page filters."""
+    store = _sqlite_transfer_store()
+    if store is not None:
+        return store.summarize(filters)
+
+    filtered_df = filter_transfers(get_all_transfers(), filters)
+    has_rows = len(filtered_df) > 0
+    return {
+        "count": len(filtered_df),
+        "total_value": filtered_df["Value ($M)"].sum(),
+        "avg_score": filtered_df["Score"].mean() if has_rows else 0,
+        "avg_rating": filtered_df["Rating"].mean() if has_rows else 0,
+    }
+
+
+def get_transfer_page(filters: Dict, sort_col: str, ascending: bool, limit: int, offset: int) -> pd.DataFrame:
+    """Get one sorted page of transfers matching the Database page filters."""
+    store = _sqlite_transfer_store()
+    if store is not None:
+        return store.page(filters, sort_col, ascending, limit, offset)
+
+    filtered_df = filter_transfers(get_all_transfers(), filters)
+    filtered_df = filtered_df.sort_values(sort_col, ascending=ascending)
+    return filtered_df.iloc[offset:offset + limit]
+
+
+def _build_transfers_df(players: pd.DataFrame, conferences: Dict[str, str]) -> pd.DataFrame:
+    """Flatten player store rows into database rows (conferences: team -> conference)."""
+    is_inflow = (players["direction"] == "Inflow").to_numpy()
+    team = players["team"].astype(str).to_numpy()
+    other_team = players["other_team"].astype(str).to_numpy()
+
+    return pd.DataFrame({
+        "Player": players["name"],
+        "Position": players["position"],
+        "Class": players["player_class"],
+        "From": np.where(is_inflow, other_team, team),
+        "To": np.where(is_inflow, team, other_team),
+        "Rating": players["hs_rating"],
+        "Score": players["score"],
+        "Value ($M)": players["value"],
+        "Games": players["games_played"],
+        "Date Transferred": players["transfer_date"],
+        "Type": players["direction"],
+        "Conference": players["team"].map(conferences).astype("category"),
+    }).reset_index(drop=True)
@@ -0,0 +1,262 @@
+"""
+Player Entity Resolution Across Scraped Sources
+
+Links the rows of the three scraped frames (247 transfers, 247 recruit
+rankings and the wide ESPN stats frame), which share no key, into one
+player table with a stable player_id.
+
+A player_id is derived only from fields that stay with the player: the
+name plus the 247Sports profile slug when a 247 row has one, else the
+recruit's high school, else the transfer row's position or the stats
+row's team and season. It does not depend on row order or on which other
+rows joined the cluster. Rows no persistent field tells apart share an ID.
+
+Names are normalized once (accents, punctuation and suffixes removed).
+Candidate pairs come only from blocks: rows sharing an exact normalized
+name, or a phonetic key (Soundex of one name plus the other's initial). So
+the fuzzy scoring runs on a handful of rows per block instead of every
+pair across tens of thousands of rows. Pairs are accepted best-first, and
+a player never gets two rows from the same source.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# Minimum pair score to link two rows
+MATCH_THRESHOLD = 0.88
+
+# Blocks bigger than this are skipped for fuzzy scoring (very common
+# phonetic keys); exact-name blocks are always scored
+MAX_BLOCK_SIZE = 200
+
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+_NON_ALPHA = re.compile(r"[^a-z ]+")
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"), **dict.fromkeys("dt", "3"),
+    "l": "4", **dict.fromkeys("mn", "5"), "r": "6",
+}
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lowercase ASCII name without punctuation or generational suffixes."""
+    if not name or name != name:
+        return ""
+    ascii_name = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode("ascii")
+    parts = _NON_ALPHA.sub(" ", ascii_name.lower().replace("'", "").replace(".", "")).split()
+    while len(parts) > 1 and parts[-1] in _SUFFIXES:
+        parts.pop()
+    return " ".join(parts)
+
+
+def soundex(word: str) -> str:
+    """American Soundex code of a lowercase ASCII word (e.g. 'robert' -> 'r163')."""
+    if not word:
+        return ""
+    code = word[0]
+    last = _SOUNDEX_CODES.get(word[0], "")
+    for char in word[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        if char not in "hw":
+            last = digit
+    return code.ljust(4, "0")
+
+
+def blocking_keys(normalized: str) -> Tuple[str, ...]:
+    """
+    Exact and phonetic block keys for a normalized name.
+
+    The two phonetic keys (first initial + last-name Soundex, and first-name
+    Soundex + last initial) let a typo in either name still share a block.
+    """
+    parts = normalized.split()
+    if not parts:
+        return ()
+    first, last = parts[0], parts[-1]
+    return f"n:{normalized}", f"p:{first[0]}{soundex(last)}", f"f:{soundex(first)}{last[0]}"
+
+
+def _score(a: Dict, b: Dict, matcher: SequenceMatcher, threshold: float = 0.0) -> float:
+    """
+    Name similarity adjusted for position agreement.
+
+    `matcher` already holds a's name as its second sequence (difflib caches
+    that side), and the pair returns 0 as soon as a cheap upper bound
+    (length, then character multiset) shows it cannot reach the threshold.
+    """
+    if a["profile"] and b["profile"]:
+        # Both 247 rows link a profile: same player exactly when the slugs agree
+        return 2.0 if a["profile"] == b["profile"] else 0.0
+    bonus = 0.0
+    if a["position"] and b["position"]:
+        bonus = 0.05 if a["position"] == b["position"] else -0.15
+    if a["norm"] == b["norm"]:
+        return 1.0 + bonus
+    la, lb = len(a["norm"]), len(b["norm"])
+    if 2.0 * min(la, lb) / (la + lb) + bonus < threshold:
+        return 0.0
+    matcher.set_seq1(b["norm"])
+    if matcher.quick_ratio() + bonus < threshold:
+        return 0.0
+    return matcher.ratio() + bonus
+
+
+def player_id(normalized: str, anchor: Optional[str]) -> str:
+    """Stable ID from a normalized name plus a persistent field (see _id_anchor)."""
+    digest = hashlib.blake2b(f"{normalized}|{anchor or ''}".encode("utf-8"), digest_size=6).hexdigest()
+    return f"p{digest}"
+
+
+def _id_anchor(members: Dict[str, Dict]) -> Tuple[Dict, str]:
+    """
+    The row and persistent field a cluster's player_id is derived from.
+
+    In order: a 247 profile slug (transfers, then recruits), the recruit's
+    high school, the transfer row's position, the stats row's team and season.
+    """
+    for source in ("transfers", "recruits"):
+        member = members.get(source)
+        if member and member["profile"]:
+            return member, f"247:{member['profile']}"
+    recruit = members.get("recruits")
+    if recruit and recruit["high_school"]:
+        return recruit, f"hs:{normalize_name(recruit['high_school'])}"
+    for source in ("transfers", "recruits"):
+        if source in members:
+            return members[source], f"pos:{members[source]['position'] or ''}"
+    stats = members["stats"]
+    return stats, f"team:{stats['team'] or ''}|{stats['season'] or ''}"
+
+
+def _column(frame: pd.DataFrame, name: str) -> pd.Series:
+    return frame[name] if name in frame.columns else pd.Series(None, index=frame.index, dtype=object)
+
+
+def _text_or_none(value) -> Optional[str]:
+    return value if isinstance(value, str) and value else None
+
+
+def _records(source: str, frame: Optional[pd.DataFrame]) -> List[Dict]:
+    if frame is None or frame.empty:
+        return []
+    columns = zip(frame.index, frame["name"], _column(frame, "position"), _column(frame, "team"),
+                  _column(frame, "profile"), _column(frame, "high_school"), _column(frame, "season"))
+    return [
+        {"source": source, "index": index, "name": name, "norm": normalize_name(name),
+         "position": _text_or_none(position), "team": _text_or_none(team),
+         "profile": _text_or_none(profile), "high_school": _text_or_none(high_school),
+         "season": None if season is None or season != season else int(season)}
+        for index, name, position, team, profile, high_school, season in columns
+    ]
+
+
+def _cluster_order(members: Dict[str, Dict]) -> Tuple:
+    """Deterministic order of the output player rows (IDs do not depend on it)."""
+    return tuple((source, str(members[source]["index"])) if source in members else ("", "")
+                 for source in ("transfers", "recruits", "stats"))
+
+
+def resolve_players(
+    transfers: Optional[pd.DataFrame] = None,
+    recruits: Optional[pd.DataFrame] = None,
+    stats: Optional[pd.DataFrame] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Link transfer, recruit and stats rows that refer to the same player.
+
+    Args:
+        transfers: 247 transfer portal rows (name, position, profile, ...)
+        recruits: 247 recruit ranking rows (name, position, high_school, profile, ...)
+        stats: Wide ESPN stats rows (name, team, season, stat columns)
+
+    Returns:
+        Dict with 'players' (one row per player: player_id, name, position,
+        team and the row index in each source, NaN where absent; namesakes
+        no persistent field separates share a player_id) and
+        'transfers'/'recruits'/'stats': copies of the inputs with a player_id
+        column
+    """
+    sources = {"transfers": transfers, "recruits": recruits, "stats": stats}
+    records = [record for source, frame in sources.items() for record in _records(source, frame)]
+
+    # Block on exact and phonetic keys
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for i, record in enumerate(records):
+        if record["norm"]:
+            for key in blocking_keys(record["norm"]):
+                blocks[key].append(i)
+
+    # Score cross-source pairs inside each block
+    candidates = {}
+    scored = set()
+    for key, members in blocks.items():
+        if len(members) < 2 or (not key.startswith("n:") and len(members) > MAX_BLOCK_SIZE):
+            continue
+        for x in range(len(members)):
+            a = records[members[x]]
+            matcher = SequenceMatcher(None, autojunk=False)
+            matcher.set_seq2(a["norm"])
+            for y in range(x + 1, len(members)):
+                b = records[members[y]]
+                if a["source"] == b["source"]:
+                    continue
+                pair = (members[x], members[y])
+                if pair not in scored:
+                    scored.add(pair)
+                    score = _score(a, b, matcher, MATCH_THRESHOLD)
+                    if score >= MATCH_THRESHOLD:
+                        candidates[pair] = score
+
+    # Union best pairs first; a player never gets two rows from one source
+    parent = list(range(len(records)))
+    cluster_sources = [{record["source"]} for record in records]
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for (a, b), _ in sorted(candidates.items(), key=lambda item: (-item[1], item[0])):
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b or cluster_sources[root_a] & cluster_sources[root_b]:
+            continue
+        parent[root_b] = root_a
+        cluster_sources[root_a] |= cluster_sources[root_b]
+
+    # Stable IDs from each cluster's representative (transfer, else recruit, else stats row)
+    clusters: Dict[int, Dict[str, Dict]] = defaultdict(dict)
+    for i, record in enumerate(records):
+        clusters[find(i)][record["source"]] = record
+
+    rows = []
+    ids_by_record: Dict[Tuple[str, object], str] = {}
+    for members in sorted(clusters.values(), key=_cluster_order):
+        rep = members.get("transfers") or members.get("recruits") or members["stats"]
+        position = next((m["position"] for m in members.values() if m["position"]), None)
+        team = next((m["team"] for m in members.values() if m["team"]), None)
+        anchor_row, anchor = _id_anchor(members)
+        pid = player_id(anchor_row["norm"], anchor)
+        for source, member in members.items():
+            ids_by_record[(source, member["index"])] = pid
+        row = {"player_id": pid, "name": rep["name"], "position": position, "team": team}
+        for source in sources:
+            row[f"{source}_index"] = members[source]["index"] if source in members else None
+        rows.append(row)
+
+    result = {"players": pd.DataFrame(rows, columns=[
+        "player_id", "name", "position", "team", *[f"{source}_index" for source in sources]
+    ])}
+    for source, frame in sources.items():
+        if frame is not None:
+            result[source] = frame.assign(player_id=[ids_by_record.get((source, i)) for i in frame.index])
+    return result
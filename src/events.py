@@ -0,0 +1,116 @@
+"""
+Transfer Event Log for NIL or Nothing
+
+Transfer events (see ranking.EVENT_TYPES) are appended to a per-season
+log instead of being applied in one process only. Every dashboard process
+replays the log on top of the snapshot it loads and tails it for events
+other processes logged, and the refresh worker folds the log into each
+version it publishes (its manifest records how many events it holds), so
+an event survives TTL reloads, hot-swapped versions and restarts.
+
+The refresh worker also logs the commitments and flips it scrapes (see
+change_to_event).
+
+Layout under the events directory:
+    league-<season>.jsonl    every logged event, oldest first
+"""
+
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.changes import CHANGE_COMMITTED, CHANGE_FLIPPED
+from src.ranking import EVENT_COMMITTED, EVENT_FLIPPED, event_changes
+from src.snapshot import DATA_DIR
+
+EVENTS_DIR = DATA_DIR / "events"
+
+
+class EventLog:
+    """Append-only JSON-lines log of one season's transfer events."""
+
+    def __init__(self, season: int, directory=EVENTS_DIR):
+        self.path = Path(directory) / f"league-{season}.jsonl"
+
+    def append(self, event: Dict) -> Dict:
+        """
+        Validate, stamp and log an event.
+
+        The event gets an "id" and a "recorded_at" time (replays use it as
+        the default transfer date, so every process derives the same rows).
+        The line is written with a single O_APPEND write, so processes
+        logging at the same time never interleave.
+
+        Returns:
+            The logged event
+
+        Raises:
+            ValueError: If the event type is unknown
+        """
+        event_changes(event)
+        event = {**event, "id": uuid.uuid4().hex, "recorded_at": event.get("recorded_at", time.time())}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, (json.dumps(event) + "\n").encode("utf-8"))
+        finally:
+            os.close(fd)
+        return event
+
+    def size(self) -> int:
+        """Bytes logged so far (0 without a log): a cheap "anything new?" check."""
+        try:
+            return os.stat(self.path).st_size
+        except OSError:
+            return 0
+
+    def read(self, offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Read the events logged from a byte offset on.
+
+        A line still being written is left for the next read.
+
+        Returns:
+            (events in log order, offset just past the last complete line)
+        """
+        try:
+            with open(self.path, "rb") as log:
+                log.seek(offset)
+                data = log.read()
+        except OSError:
+            return [], offset
+
+        end = data.rfind(b"\n") + 1
+        events = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+        return events, offset + end
+
+
+def change_to_event(change: Dict) -> Optional[Dict]:
+    """
+    Transfer event for a scraped portal change (see changes.diff_rows).
+
+    Only commitments and flips name the teams involved; the scraped
+    transfers carry no previous school, so entries and withdrawals (and
+    rating moves) give None. The player is valued on their rating alone.
+    """
+    from src.valuation import calculate_player_value
+
+    if change.get("type") == CHANGE_COMMITTED and change.get("destination"):
+        event = {"type": EVENT_COMMITTED, "to_team": change["destination"]}
+    elif change.get("type") == CHANGE_FLIPPED and change.get("destination"):
+        event = {"type": EVENT_FLIPPED, "to_team": change["destination"],
+                 "previous_team": change.get("previous_destination")}
+    else:
+        return None
+
+    player = {"name": change.get("name"), "position": change.get("position")}
+    if change.get("rating") is not None:
+        valued = calculate_player_value(hs_rating=float(change["rating"]), position=change.get("position"))
+        player.update(hs_rating=float(change["rating"]), score=valued["score"], value=valued["value"])
+    event["player"] = player
+    if change.get("detected_at") is not None:
+        event["recorded_at"] = change["detected_at"]
+    return event
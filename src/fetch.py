@@ -0,0 +1,321 @@
+"""
+HTTP Fetch Engine for the Transfer Portal Scraper
+
+Runs scraper requests on a shared thread pool while a per-host token
+bucket keeps each site at a polite request rate, so 247Sports and ESPN
+pages download in parallel instead of one at a time with fixed sleeps.
+With a ResponseCache attached, requests are conditional and unchanged
+pages are served from disk.
+
+Transient failures (connection errors, timeouts, 429 and 5xx answers) are
+retried with bounded exponential backoff and full jitter. A per-host
+circuit breaker stops sending requests to a host that keeps failing, so
+a site outage fails fast instead of tying up every worker in retries.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.http_cache import ResponseCache
+
+# Per-host (requests per second, burst size)
+DEFAULT_RATE_LIMITS = {
+    "247sports.com": (2.0, 4),
+    "www.espn.com": (2.0, 4),
+}
+
+# Rate limit for hosts not listed above
+DEFAULT_HOST_RATE = (1.0, 2)
+
+# Statuses worth retrying: rate limited or a temporary server-side failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+def is_not_found(error: Exception) -> bool:
+    """Whether a fetch error is an HTTP 404 (e.g. a page past the end of a listing)."""
+    response = getattr(error, "response", None)
+    return isinstance(error, requests.HTTPError) and response is not None and response.status_code == 404
+
+
+class RetryPolicy:
+    """
+    Bounded exponential backoff with full jitter.
+
+    Args:
+        retries: Retries after the first attempt (0 = no retries)
+        backoff: Delay cap for the first retry, in seconds; doubles per retry
+        max_backoff: Upper bound on any single delay
+        rng: Random source for jitter (seed it for reproducible tests)
+    """
+
+    def __init__(self, retries: int = 3, backoff: float = 0.5, max_backoff: float = 8.0,
+                 rng: Optional[random.Random] = None):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._rng = rng or random.Random()
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before retry number attempt + 1 (honors a numeric Retry-After)."""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return self._rng.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: opens after `threshold` consecutive failures, rejects
+    requests for `reset_timeout` seconds, then lets one trial request through
+    (half-open) and closes again if it succeeds.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError("circuit open")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """End a request that neither succeeded nor failed at the host, so another trial may run."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchEngine:
+    """Concurrent GETs over a shared session with per-host rate limiting."""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        max_workers: int = 8,
+        timeout: float = 10,
+        cache: Optional[ResponseCache] = None,
+        url_rewriter: Optional[Callable[[str], str]] = None,
+        recorder=None,
+        retry: Optional[RetryPolicy] = None,
+        breaker_threshold: int = 5,
+        breaker_reset: float = 30.0,
+    ):
+        """
+        Args:
+            session: Session used for every request
+            rate_limits: Per-host (requests per second, burst) overrides
+            max_workers: Maximum concurrent requests across all hosts
+            timeout: Per-request timeout in seconds
+            cache: Optional ResponseCache for conditional requests
+            url_rewriter: Maps a live URL to the URL actually requested
+                (e.g. a replay.ReplayServer); rate limits and cache keys
+                still use the live URL
+            recorder: Optional replay.FixtureRecorder saving every response
+            retry: Backoff policy for transient failures (default RetryPolicy())
+            breaker_threshold: Consecutive failures that open a host's circuit
+            breaker_reset: Seconds a host's circuit stays open before a trial request
+        """
+        self.session = session
+        self.cache = cache
+        self.url_rewriter = url_rewriter
+        self.recorder = recorder
+        self.rate_limits = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+        self.timeout = timeout
+        self.retry = retry or RetryPolicy()
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._buckets_lock = threading.Lock()
+
+        # One pooled connection per worker per host, so concurrent requests
+        # reuse keep-alive connections instead of opening and dropping them;
+        # retries are handled here rather than by urllib3
+        adapter = HTTPAdapter(pool_connections=max(len(self.rate_limits), 4), pool_maxsize=max_workers, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._buckets_lock:
+            if host not in self._buckets:
+                rate, capacity = self.rate_limits.get(host, DEFAULT_HOST_RATE)
+                self._buckets[host] = TokenBucket(rate, capacity)
+            return self._buckets[host]
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """Get the circuit breaker for a host."""
+        with self._buckets_lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+            return self._breakers[host]
+
+    def fetch(self, url: str) -> requests.Response:
+        """
+        GET a URL once its host's rate limit allows.
+
+        Transient failures are retried per the RetryPolicy; the final
+        response (possibly still a 5xx) is returned, or the last exception
+        raised. Raises CircuitOpenError while the host's circuit is open.
+
+        With a cache, the request carries the stored validators; a 304 is
+        answered from disk as a 200 with `not_modified = True`. Cached or
+        stored responses carry the body's SHA-256 as `body_hash`.
+        """
+        if self.cache is None:
+            return self._get_with_retries(url)
+
+        entry = self.cache.get_entry(url)
+        response = self._get_with_retries(url, headers=self.cache.conditional_headers(entry))
+        if response.status_code == 304 and entry:
+            response = self.cache.cached_response(url, entry)
+            response.body_hash = entry["body_hash"]
+            response.not_modified = True
+        elif response.status_code == 200:
+            response.body_hash = self.cache.store(url, response)
+            response.not_modified = False
+        return response
+
+    def _get_with_retries(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Rate-limited GET with backoff on transient failures, guarded by the host's breaker."""
+        host = urlsplit(url).hostname or ""
+        breaker = self.breaker(host)
+
+        for attempt in range(self.retry.retries + 1):
+            breaker.before_request()
+            self._bucket(host).acquire()
+            try:
+                response = self._get(url, headers=headers)
+            except (requests.ConnectionError, requests.Timeout):
+                breaker.record_failure()
+                if attempt == self.retry.retries:
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                continue
+            except requests.RequestException:
+                # Not retried (e.g. ChunkedEncodingError), but still a failure at the host
+                breaker.record_failure()
+                raise
+            except BaseException:
+                breaker.release_trial()
+                raise
+
+            if response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if attempt == self.retry.retries:
+                return response
+            time.sleep(self.retry.delay(attempt, response))
+
+    def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Send the GET (to the rewritten URL, if any) and record the response."""
+        target = self.url_rewriter(url) if self.url_rewriter else url
+        response = self.session.get(target, headers=headers, timeout=self.timeout)
+        if self.recorder is not None and response.status_code != 304:
+            self.recorder.record(url, response)
+        return response
+
+    def fetch_many(
+        self, urls: Iterable[str], window: Optional[int] = None
+    ) -> Iterator[Tuple[str, Union[requests.Response, Exception]]]:
+        """
+        Fetch URLs concurrently, yielding (url, response or exception) in input order.
+
+        Args:
+            urls: URLs to fetch
+            window: Maximum requests in flight ahead of the caller (None = all
+                at once). A small window lets a caller that stops early (e.g.
+                an incremental refresh) avoid requesting pages it won't read.
+        """
+        urls = iter(urls)
+        futures: Deque[Tuple[str, Future]] = deque()
+
+        def fill() -> None:
+            while window is None or len(futures) < window:
+                url = next(urls, None)
+                if url is None:
+                    return
+                futures.append((url, self._executor.submit(self.fetch, url)))
+
+        try:
+            fill()
+            while futures:
+                url, future = futures.popleft()
+                try:
+                    response = future.result()
+                except Exception as e:
+                    response = e
+                fill()
+                yield url, response
+        finally:
+            # Caller stopped early (e.g. a failed page) - drop queued requests
+            for _, future in futures:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
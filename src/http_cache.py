@@ -0,0 +1,128 @@
+"""
+On-disk HTTP Response Cache for the Transfer Portal Scraper
+
+Keeps the last response for each URL with its ETag/Last-Modified
+validators so refreshes can send conditional requests. Bodies and parsed
+rows are stored gzip-compressed and addressed by the SHA-256 of the body,
+so an unchanged page (304, or 200 with an identical body) is neither
+re-downloaded into a new file nor re-parsed.
+
+Layout under the cache directory:
+    urls/<sha256(url)>.json             validators + body hash for a URL
+    bodies/<sha256(body)>.gz            raw response body
+    parsed/<sha256(body)>-<parser>.json.gz   rows produced by a parser
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest used to address bodies and parsed rows."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write a file via a temp file and rename, so readers never see partial data.
+
+    Each write gets its own temp file, so threads or processes writing the
+    same entry never share one; the last rename wins.
+    """
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as tmp:
+        tmp.write(data)
+    try:
+        os.replace(tmp.name, path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
+
+class ResponseCache:
+    """Content-addressed, compressed response cache with HTTP revalidation."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        for sub in ("urls", "bodies", "parsed"):
+            (self.directory / sub).mkdir(parents=True, exist_ok=True)
+
+    def _url_path(self, url: str) -> Path:
+        return self.directory / "urls" / f"{content_hash(url.encode('utf-8'))}.json"
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.directory / "bodies" / f"{body_hash}.gz"
+
+    def _parsed_path(self, body_hash: str, parser: str) -> Path:
+        return self.directory / "parsed" / f"{body_hash}-{parser}.json.gz"
+
+    def get_entry(self, url: str) -> Optional[Dict]:
+        """Get the stored validators and body hash for a URL, if any."""
+        try:
+            entry = json.loads(self._url_path(url).read_text())
+        except (OSError, ValueError):
+            return None
+        return entry if self._body_path(entry["body_hash"]).exists() else None
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a cached entry."""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, response: requests.Response) -> str:
+        """
+        Save a 200 response's body and validators.
+
+        Returns:
+            SHA-256 of the body
+        """
+        body = response.content
+        body_hash = content_hash(body)
+        body_path = self._body_path(body_hash)
+        if not body_path.exists():
+            atomic_write(body_path, gzip.compress(body))
+
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "encoding": response.encoding,
+            "body_hash": body_hash,
+            "fetched_at": time.time(),
+        }
+        atomic_write(self._url_path(url), json.dumps(entry).encode("utf-8"))
+        return body_hash
+
+    def cached_response(self, url: str, entry: Dict) -> requests.Response:
+        """Rebuild a 200 response from a cache entry (used when the server answers 304)."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = gzip.decompress(self._body_path(entry["body_hash"]).read_bytes())
+        response.encoding = entry.get("encoding")
+        response.headers = CaseInsensitiveDict({"Content-Type": entry.get("content_type") or "text/html"})
+        return response
+
+    def get_parsed(self, body_hash: str, parser: str) -> Optional[List[Dict]]:
+        """Get rows a parser previously produced for this exact body."""
+        try:
+            return json.loads(gzip.decompress(self._parsed_path(body_hash, parser).read_bytes()))
+        except (OSError, ValueError):
+            return None
+
+    def put_parsed(self, body_hash: str, parser: str, rows: List[Dict]) -> None:
+        """Save the rows a parser produced for a body."""
+        atomic_write(self._parsed_path(body_hash, parser), gzip.compress(json.dumps(rows).encode("utf-8")))
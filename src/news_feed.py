@@ -8,7 +8,9 @@ NOTE: This uses SAMPLE DATA for demonstration purposes.
 Real-time news would require integration with sports news APIs.
 """
 
+import html
 import random
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict
 
@@ -213,6 +215,76 @@ def get_time_ago(minutes: int) -> str:
         return f"{days}d ago"
 
 
+# News category for each scraped change type (see changes.CHANGE_TYPES)
+CHANGE_CATEGORIES = {
+    "new_entry": "entry",
+    "withdrawn": "entry",
+    "committed": "commitment",
+    "flipped": "decommit",
+    "rating_change": "analysis",
+}
+
+
+def _change_headline(change: Dict) -> Dict[str, str]:
+    """Title and summary for a scraped change event."""
+    name = change.get("name") or "Unknown player"
+    position = change.get("position") or "Player"
+    rating = change.get("rating")
+    rating_text = f" ({rating})" if rating is not None else ""
+    change_type = change["type"]
+
+    if change_type == "new_entry":
+        return {"title": f"{position} {name} enters the transfer portal",
+                "summary": f"{name}{rating_text} is now listed in the portal."}
+    if change_type == "committed":
+        return {"title": f"{position} {name} commits to {change.get('destination') or 'a new school'}",
+                "summary": f"{name}{rating_text} is off the board."}
+    if change_type == "flipped":
+        return {"title": f"{position} {name} flips from {change.get('previous_destination')} to {change.get('destination')}",
+                "summary": f"{name}{rating_text} has changed commitments."}
+    if change_type == "withdrawn":
+        return {"title": f"{position} {name} withdraws from the transfer portal",
+                "summary": f"{name}{rating_text} is no longer in the portal."}
+    return {"title": f"{position} {name} rating moves to {rating}",
+            "summary": f"Previously rated {change.get('previous_rating')}."}
+
+
+def get_scraped_news(count: int = 15, category: str = "all") -> List[Dict]:
+    """
+    Get news items for the latest scraped portal changes (see changes.ChangeTracker).
+
+    Args:
+        count: Maximum number of items to return
+        category: Filter by category ('all', 'commitment', 'entry', ...)
+
+    Returns:
+        Newest-first news items in the same shape as get_latest_news
+    """
+    from src.changes import ChangeTracker
+
+    now = time.time()
+    items = []
+    for change in ChangeTracker().recent(limit=count * 4):
+        item_category = CHANGE_CATEGORIES.get(change.get("type"))
+        if item_category is None or (category != "all" and item_category != category):
+            continue
+        minutes_ago = max(0, int((now - change.get("detected_at", now)) // 60))
+        # Names come from scraped pages and the Live Feed renders items as HTML
+        headline = {key: html.escape(text) for key, text in _change_headline(change).items()}
+        items.append({
+            **headline,
+            "source": "247Sports",
+            "url": "https://247sports.com",
+            "category": item_category,
+            "time_ago": get_time_ago(minutes_ago),
+            "minutes_ago": minutes_ago,
+            "source_color": SOURCE_COLORS["247Sports"],
+        })
+        if len(items) >= count:
+            break
+    return items
+
+
 def get_latest_news(count: int = 15, category: str = "all") -> List[Dict]:
     """
     Get the latest transfer portal news.
@@ -222,8 +294,12 @@ def get_latest_news(count: int = 15, category: str = "all") -> List[Dict]:
         category: Filter by category ('all', 'commitment', 'entry', 'rumor', 'analysis')
 
     Returns:
-        List of news items with timestamps
+        List of news items with timestamps; scraped portal changes come
+        first, topped up with sample items
     """
+    scraped = get_scraped_news(count, category)
+    count -= len(scraped)
+
     # Filter by category if specified
     if category != "all":
         filtered = [n for n in MOCK_NEWS if n["category"] == category]
@@ -245,7 +321,7 @@ def get_latest_news(count: int = 15, category: str = "all") -> List[Dict]:
             "source_color": SOURCE_COLORS.get(item["source"], "#666"),
         })
 
-    return news_with_time
+    return scraped + news_with_time
 
 
 def get_news_categories() -> List[Dict]:
@@ -0,0 +1,202 @@
+"""
+Page Parsers for the Transfer Portal Scraper
+
+Module-level functions that turn raw page bytes into row dicts. They take
+and return only plain data, so the scraper can run them in worker
+processes (see pipeline.FetchParsePipeline) as well as inline.
+
+Pages are streamed through lxml's iterparse: each player row is handed to
+precompiled XPath field selectors as soon as its closing tag is read, then
+cleared, so a large rankings page never holds more than one row's subtree
+plus the bare page skeleton.
+"""
+
+import re
+from io import BytesIO
+from typing import Callable, Dict, Iterator, List, Optional
+
+from lxml import etree
+
+# Look for decimal ratings like 0.9842 or 94.2
+RATING_PATTERN = re.compile(r'(\d+\.?\d*)')
+
+# 247Sports player profile links, e.g. /Player/John-Smith-46096999/
+PROFILE_PATTERN = re.compile(r'/Player/([^/?#]+)', re.IGNORECASE)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching a single CSS class token."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _first(*conditions: str) -> etree.XPath:
+    """Compile 'first descendant matching any condition' (CSS select_one)."""
+    return etree.XPath(f"descendant::*[{' or '.join(conditions)}][1]")
+
+
+# 247Sports transfer portal rows and fields
+TRANSFER_ROW = etree.XPath(
+    f"self::*[{_has_class('transfer-portal-row')} or {_has_class('player-row')}"
+    f" or (self::li and {_has_class('rankings-page__list-item')})]"
+)
+TRANSFER_NAME = _first(_has_class('name'), _has_class('player-name'),
+                       f"(self::a and {_has_class('rankings-page__name-link')})")
+TRANSFER_RATING = _first(_has_class('rating'), _has_class('score'), _has_class('rankings-page__star-and-score'))
+TRANSFER_POSITION = _first(_has_class('position'), _has_class('pos'))
+TRANSFER_STATUS = _first(_has_class('status'), _has_class('transfer-status'))
+TRANSFER_DESTINATION = _first(_has_class('destination'), _has_class('transfer-destination'))
+
+# 247Sports recruit ranking rows and fields
+RECRUIT_ROW = etree.XPath(f"self::li[{_has_class('rankings-page__list-item')}]")
+RECRUIT_NAME = _first(_has_class('rankings-page__name-link'))
+RECRUIT_RATING = _first(_has_class('rankings-page__star-and-score'))
+RECRUIT_POSITION = _first(_has_class('position'))
+RECRUIT_SCHOOL = _first(_has_class('rankings-page__school'))
+RECRUIT_COMMIT = _first(_has_class('rankings-page__commitment'))
+
+# Link to the player's 247Sports profile (in transfer and recruit rows)
+PLAYER_PROFILE = etree.XPath("descendant-or-self::a[contains(@href, '/Player/')][1]/@href")
+
+# ESPN stat table cells
+TABLE_CELLS = etree.XPath("descendant::td")
+
+
+def _text(elem) -> Optional[str]:
+    """Stripped text of an element (like BeautifulSoup's get_text(strip=True))."""
+    if elem is None:
+        return None
+    return "".join(piece.strip() for piece in elem.itertext())
+
+
+def _select_text(selector: etree.XPath, row) -> Optional[str]:
+    found = selector(row)
+    return _text(found[0]) if found else None
+
+
+def _release(elem) -> None:
+    """Free a processed element and the already-processed siblings before it."""
+    elem.clear(keep_tail=True)
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def _iter_rows(html: bytes, is_row: etree.XPath) -> Iterator:
+    """Stream a page, yielding each element matching is_row once it is complete."""
+    for _, elem in etree.iterparse(BytesIO(html), events=('end',), html=True, recover=True):
+        if is_row(elem):
+            yield elem
+            _release(elem)
+
+
+def extract_rating(elem) -> Optional[float]:
+    """Extract numeric rating from element."""
+    text = _text(elem)
+    if not text:
+        return None
+    match = RATING_PATTERN.search(text)
+    return float(match.group(1)) if match else None
+
+
+def _select_rating(selector: etree.XPath, row) -> Optional[float]:
+    found = selector(row)
+    return extract_rating(found[0]) if found else None
+
+
+def extract_profile(row) -> Optional[str]:
+    """247Sports profile slug of a row's player link (e.g. 'john-smith-46096999')."""
+    hrefs = PLAYER_PROFILE(row)
+    match = PROFILE_PATTERN.search(hrefs[0]) if hrefs else None
+    return match.group(1).lower() if match else None
+
+
+def parse_247_player(row) -> Optional[Dict]:
+    """Parse a single player row from 247Sports."""
+    try:
+        player = {
+            'name': _select_text(TRANSFER_NAME, row),
+            'rating': _select_rating(TRANSFER_RATING, row),
+            'position': _select_text(TRANSFER_POSITION, row),
+            'status': _select_text(TRANSFER_STATUS, row),
+            'destination': _select_text(TRANSFER_DESTINATION, row),
+            'profile': extract_profile(row),
+            'source': '247Sports'
+        }
+
+        # Only return if we got at least a name
+        return player if player['name'] else None
+
+    except Exception:
+        return None
+
+
+def _parse_rows(html: bytes, is_row: etree.XPath, parse_row: Callable) -> List[Dict]:
+    rows = []
+    for row in _iter_rows(html, is_row):
+        parsed = parse_row(row)
+        if parsed:
+            rows.append(parsed)
+    return rows
+
+
+def parse_247_transfer_page(html: bytes) -> List[Dict]:
+    """Parse every player row on a 247Sports transfer portal page."""
+    return _parse_rows(html, TRANSFER_ROW, parse_247_player)
+
+
+def parse_recruit(row) -> Optional[Dict]:
+    """Parse a single recruit row."""
+    try:
+        return {
+            'name': _select_text(RECRUIT_NAME, row),
+            'rating': _select_rating(RECRUIT_RATING, row),
+            'position': _select_text(RECRUIT_POSITION, row),
+            'high_school': _select_text(RECRUIT_SCHOOL, row),
+            'committed_to': _select_text(RECRUIT_COMMIT, row),
+            'profile': extract_profile(row),
+            'source': '247Sports'
+        }
+    except Exception:
+        return None
+
+
+def parse_recruit_page(html: bytes) -> List[Dict]:
+    """Parse every recruit row on a 247Sports rankings page."""
+    return _parse_rows(html, RECRUIT_ROW, parse_recruit)
+
+
+def parse_espn_page(html: bytes, stat_type: str, year: int) -> List[Dict]:
+    """Parse the player rows of an ESPN stats page."""
+    players = []
+    # Rows seen so far in each open <table>; the first row is the header
+    rows_seen = []
+
+    # ESPN structure varies, may need adjustment
+    for event, elem in etree.iterparse(BytesIO(html), events=('start', 'end'), tag=('table', 'tr'),
+                                       html=True, recover=True):
+        if elem.tag == 'table':
+            if event == 'start':
+                rows_seen.append(0)
+            elif rows_seen:
+                rows_seen.pop()
+            continue
+        if event != 'end' or not rows_seen:
+            continue
+
+        rows_seen[-1] += 1
+        if rows_seen[-1] > 1:  # Skip header
+            cells = TABLE_CELLS(elem)
+            if len(cells) >= 2:
+                players.append({
+                    'name': _text(cells[0]),
+                    'team': _text(cells[1]),
+                    'stat_value': _text(cells[2]) if len(cells) > 2 else None,
+                    'stat_type': stat_type,
+                    'year': year,
+                    'source': 'ESPN'
+                })
+        # Nested tables still need this row's cells
+        if len(rows_seen) == 1:
+            _release(elem)
+    return players
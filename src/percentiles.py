@@ -0,0 +1,276 @@
+"""
+Position-Aware Stats Percentiles for NIL or Nothing
+
+Turns ESPN stat lines into the `stats_percentile` input of the valuation.
+Each position group is compared only against players in the same group,
+on the stats that matter for it (passing and rushing for QBs, sacks and
+tackles for the defensive line, ...). A player's percentile is the mean
+of their per-stat percentiles.
+
+Values are kept in one sorted array per (group, stat), so a percentile is
+a binary search. New stat rows are merged in incrementally, and whole
+player columns are answered with one np.searchsorted call per
+(group, stat).
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Position -> comparison group
+POSITION_GROUPS = {
+    "QB": "QB",
+    "RB": "RB",
+    "WR": "REC",
+    "TE": "REC",
+    "DE": "DL",
+    "EDGE": "DL",
+    "DT": "DL",
+    "LB": "LB",
+    "CB": "DB",
+    "S": "DB",
+}
+
+# Stats that rate each group (columns of scraper.espn_stats_wide)
+GROUP_STATS = {
+    "QB": ["passing", "rushing"],
+    "RB": ["rushing", "receiving"],
+    "REC": ["receiving"],
+    "DL": ["sacks", "tackles"],
+    "LB": ["tackles", "sacks"],
+    "DB": ["interceptions", "tackles"],
+}
+
+# Group assumed for an ESPN row without a position: the first stat it has, in this order
+STAT_GROUPS = [("passing", "QB"), ("rushing", "RB"), ("receiving", "REC"),
+               ("sacks", "DL"), ("interceptions", "DB"), ("tackles", "LB")]
+
+
+def infer_groups(stats: pd.DataFrame) -> np.ndarray:
+    """
+    Position group for each row of a wide stats frame.
+
+    Uses the row's position column when present; otherwise the first
+    STAT_GROUPS category the player has a value in (ESPN leader tables
+    are per category, not per position). Rows with no usable stats get None.
+    """
+    if "position" in stats.columns:
+        return stats["position"].map(POSITION_GROUPS).to_numpy(dtype=object)
+
+    groups = np.full(len(stats), None, dtype=object)
+    for stat, group in reversed(STAT_GROUPS):
+        if stat in stats.columns:
+            groups[stats[stat].notna().to_numpy()] = group
+    return groups
+
+
+class StatsPercentileEngine:
+    """Sorted per-(group, stat) distributions answering percentile queries."""
+
+    def __init__(self):
+        self._values: Dict[Tuple[str, str], List[float]] = {}
+        self._arrays: Dict[Tuple[str, str], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return sum(len(values) for values in self._values.values())
+
+    def add(self, position: str, stats: Dict[str, float]) -> None:
+        """Add one player's stat line (O(n) insort per stat, no re-sort)."""
+        group = POSITION_GROUPS.get(position, position)
+        for stat in GROUP_STATS.get(group, []):
+            value = stats.get(stat)
+            if value is None or value != value:
+                continue
+            key = (group, stat)
+            insort(self._values.setdefault(key, []), float(value))
+            self._arrays.pop(key, None)
+
+    def add_frame(self, stats: pd.DataFrame) -> None:
+        """
+        Add every row of a wide stats frame (see scraper.espn_stats_wide).
+
+        Each (group, stat) batch is sorted and merged with the existing
+        values; Python's sort merges the two sorted runs in linear time.
+        """
+        groups = infer_groups(stats)
+        for group, group_stats in GROUP_STATS.items():
+            in_group = groups == group
+            if not in_group.any():
+                continue
+            for stat in group_stats:
+                if stat not in stats.columns:
+                    continue
+                new = stats[stat].to_numpy(dtype=float)[in_group]
+                new = new[~np.isnan(new)]
+                if not len(new):
+                    continue
+                key = (group, stat)
+                merged = self._values.get(key, []) + np.sort(new).tolist()
+                merged.sort()
+                self._values[key] = merged
+                self._arrays.pop(key, None)
+
+    def _array(self, key: Tuple[str, str]) -> np.ndarray:
+        if key not in self._arrays:
+            self._arrays[key] = np.asarray(self._values.get(key, []), dtype=float)
+        return self._arrays[key]
+
+    def stat_percentile(self, position: str, stat: str, value: float) -> Optional[float]:
+        """
+        Share of the group at or below a value (ties count half), or None if
+        the group has no data for the stat.
+        """
+        values = self._values.get((POSITION_GROUPS.get(position, position), stat))
+        if not values:
+            return None
+        return (bisect_left(values, value) + bisect_right(values, value)) / (2 * len(values))
+
+    def percentile(self, position: str, stats: Dict[str, float]) -> Optional[float]:
+        """A player's stats percentile: mean over the group's stats they have."""
+        group = POSITION_GROUPS.get(position, position)
+        found = []
+        for stat in GROUP_STATS.get(group, []):
+            value = stats.get(stat)
+            if value is None or value != value:
+                continue
+            pct = self.stat_percentile(group, stat, value)
+            if pct is not None:
+                found.append(pct)
+        return round(sum(found) / len(found), 2) if found else None
+
+    def percentiles(self, positions: Sequence[str], stats: pd.DataFrame) -> np.ndarray:
+        """
+        Batch version of percentile for aligned player positions and stat rows.
+
+        Returns:
+            Float array (NaN where a player has no comparable stats)
+        """
+        groups = pd.Series(np.asarray(positions, dtype=object)).map(POSITION_GROUPS).to_numpy(dtype=object)
+        total = np.zeros(len(stats))
+        count = np.zeros(len(stats))
+
+        for group, group_stats in GROUP_STATS.items():
+            in_group = groups == group
+            if not in_group.any():
+                continue
+            for stat in group_stats:
+                values = self._array((group, stat))
+                if stat not in stats.columns or not len(values):
+                    continue
+                x = stats[stat].to_numpy(dtype=float)
+                mask = in_group & ~np.isnan(x)
+                left = np.searchsorted(values, x[mask], side="left")
+                right = np.searchsorted(values, x[mask], side="right")
+                total[mask] += (left + right) / (2 * len(values))
+                count[mask] += 1
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.round(np.where(count > 0, total / count, np.nan), 2)
+
+
+def _name_key(names: Iterable) -> pd.Series:
+    return pd.Series(list(names), dtype="string").str.lower().str.split().str.join(" ")
+
+
+def _stats_teams(players: pd.DataFrame) -> np.ndarray:
+    """Team each player's stat line was recorded for: an inflow's previous team, else their own."""
+    teams = players["team"].astype(object).to_numpy()
+    if "direction" in players.columns and "other_team" in players.columns:
+        inflow = players["direction"].astype(object).to_numpy() == "Inflow"
+        teams = np.where(inflow, players["other_team"].astype(object).to_numpy(), teams)
+    return teams
+
+
+def stats_percentile_column(
+    players: pd.DataFrame,
+    stats: pd.DataFrame,
+    engine: Optional[StatsPercentileEngine] = None,
+    season: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Players' stats_percentile column with scraped stats filled in.
+
+    Players are matched to stat rows by player_id when both frames carry
+    one (see entities.resolve_players), otherwise by normalized name plus
+    the team the stats were recorded for (an inflow's previous team) and
+    season, so namesakes never share a stat line. Matched players with
+    game experience get a percentile from the engine (built from the
+    matched season's rows of `stats` when not given); everyone else keeps
+    their existing value.
+
+    Args:
+        players: Player store rows (see data.build_player_store)
+        stats: Wide stats frame (see scraper.espn_stats_wide)
+        engine: Engine already holding the league's stat distributions
+        season: Season of the stat lines to match (the players' previous
+            season); default: the players' season column, else the latest
+            season in `stats`
+    """
+    from src.teams import REGISTRY
+
+    if "player_id" in players.columns and "player_id" in stats.columns:
+        keys = ["player_id"]
+        left = pd.DataFrame({"player_id": players["player_id"].to_numpy()})
+    else:
+        keys = ["_key", "_team_id", "season"]
+        if "season" in players.columns:
+            seasons = players["season"].to_numpy(dtype=np.int64)
+        else:
+            season = season if season is not None else (int(stats["season"].max()) if len(stats) else 0)
+            seasons = np.full(len(players), season, dtype=np.int64)
+        # Only the matched seasons' lines shape the distributions
+        stats = stats[stats["season"].isin(np.unique(seasons))]
+        left = pd.DataFrame({
+            "_key": _name_key(players["name"]).to_numpy(),
+            "_team_id": REGISTRY.ids(_stats_teams(players)),
+            "season": seasons,
+        })
+        team_ids = stats["team_id"] if "team_id" in stats.columns else REGISTRY.ids(stats["team"])
+        stats = stats.assign(_key=_name_key(stats["name"]).to_numpy(), _team_id=np.asarray(team_ids, dtype=np.int32),
+                             season=stats["season"].to_numpy(dtype=np.int64))
+
+    if engine is None:
+        engine = StatsPercentileEngine()
+        engine.add_frame(stats)
+
+    # A key shared by several stat lines (an ID given to namesakes, see
+    # entities.resolve_players, or names differing only in case or spacing)
+    # names no single line, so those players keep their existing value
+    lookup = stats.dropna(subset=keys)
+    lookup = lookup[~lookup.duplicated(subset=keys, keep=False)]
+    matched = left.merge(lookup, on=keys, how="left", validate="many_to_one")
+    pct = engine.percentiles(players["position"].astype(object).to_numpy(), matched)
+
+    has_pct = ~np.isnan(pct) & (players["games_played"].to_numpy() > 0)
+    return np.where(has_pct, pct, players["stats_percentile"].to_numpy(dtype=float))
+
+
+def apply_stats_percentiles(
+    players: pd.DataFrame,
+    stats: pd.DataFrame,
+    engine: Optional[StatsPercentileEngine] = None,
+    season: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Fill players' stats_percentile from scraped stats and revalue them.
+
+    Returns:
+        Copy of players with stats_percentile, score and value updated
+        (see stats_percentile_column for matching and `season`)
+    """
+    from src.valuation import calculate_player_values
+
+    players = players.copy()
+    players["stats_percentile"] = stats_percentile_column(players, stats, engine, season)
+    values = calculate_player_values(
+        hs_rating=players["hs_rating"].to_numpy(),
+        games_played=players["games_played"].to_numpy(),
+        stats_percentile=players["stats_percentile"].to_numpy(dtype=float),
+        position=players["position"].to_numpy(),
+        player_class=players["player_class"].to_numpy(),
+    )
+    players["value"] = values["value"]
+    players["score"] = values["score"]
+    return players
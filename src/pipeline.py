@@ -0,0 +1,117 @@
+"""
+Fetch -> Parse Pipeline for the Transfer Portal Scraper
+
+Stages:
+    fetch  - FetchEngine threads download pages (I/O bound)
+    parse  - a process pool turns page bytes into row dicts (CPU bound)
+    sink   - the caller consumes (url, rows) in page order
+
+Parsing in worker processes keeps the GIL free for network I/O, so
+many-page backfills use every core while pages are still downloading.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+import requests
+
+from src.fetch import FetchEngine
+from src.http_cache import ResponseCache, content_hash
+
+PageResult = Tuple[str, Union[List[Dict], Exception]]
+
+
+class FetchParsePipeline:
+    """
+    Runs page parsing alongside fetching.
+
+    Args:
+        fetcher: FetchEngine for the fetch stage
+        cache: Optional ResponseCache; pages whose exact body was parsed
+            before skip the parse stage
+        parse_workers: Worker processes for parsing (0 = parse inline)
+    """
+
+    def __init__(self, fetcher: FetchEngine, cache: Optional[ResponseCache] = None, parse_workers: int = 0):
+        self.fetcher = fetcher
+        self.cache = cache
+        self.parse_workers = parse_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _submit(self, response: requests.Response, parser: str, parse_fn: Callable, args: tuple) -> Tuple[Future, Optional[str]]:
+        """Start parsing a page. Returns the future and the cache key to store rows under (None = cached/no cache)."""
+        future = Future()
+        body_hash = None
+        if self.cache is not None:
+            body_hash = getattr(response, "body_hash", None) or content_hash(response.content)
+            rows = self.cache.get_parsed(body_hash, parser)
+            if rows is not None:
+                future.set_result(rows)
+                return future, None
+
+        if self.parse_workers > 0:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+            return self._pool.submit(parse_fn, response.content, *args), body_hash
+
+        try:
+            future.set_result(parse_fn(response.content, *args))
+        except Exception as e:
+            future.set_exception(e)
+        return future, body_hash
+
+    def _result(self, url: str, future: Future, body_hash: Optional[str], parser: str) -> PageResult:
+        try:
+            rows = future.result()
+        except Exception as e:
+            return url, e
+        if body_hash is not None:
+            self.cache.put_parsed(body_hash, parser, rows)
+        return url, rows
+
+    def run(
+        self, urls: List[str], parser: str, parse_fn: Callable, *args, window: Optional[int] = None
+    ) -> Iterator[PageResult]:
+        """
+        Fetch and parse pages, yielding (url, rows) in page order.
+
+        Stops after the first page that fails to fetch (non-200 status or
+        request exception), yielding (url, exception) for it; a parse
+        failure is yielded the same way.
+
+        Args:
+            urls: Pages to fetch
+            parser: Stable name for parse_fn (cache key for parsed rows)
+            parse_fn: Module-level function (bytes, *args) -> row dicts
+            *args: Extra arguments for parse_fn
+            window: Pages fetched ahead of the caller (None = all at once)
+        """
+        pending: Deque[Tuple[str, Future, Optional[str]]] = deque()
+        try:
+            for url, response in self.fetcher.fetch_many(urls, window=window):
+                if isinstance(response, Exception) or response.status_code != 200:
+                    while pending:
+                        yield self._result(*pending.popleft(), parser)
+                    if not isinstance(response, Exception):
+                        response = requests.HTTPError(str(response.status_code), response=response)
+                    yield url, response
+                    return
+
+                pending.append((url, *self._submit(response, parser, parse_fn, args)))
+
+                # Hand finished pages to the sink while later pages are still in flight
+                while pending and pending[0][1].done():
+                    yield self._result(*pending.popleft(), parser)
+
+            while pending:
+                yield self._result(*pending.popleft(), parser)
+        finally:
+            for _, future, _ in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the parse worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
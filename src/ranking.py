@@ -0,0 +1,184 @@
+"""
+Incremental Team Ranking for NIL or Nothing
+
+Applies single transfer events (commitments, portal entries, withdrawals,
+flips) to the affected teams' aggregates and keeps the league order in a
+sorted list, so one event re-ranks in O(log n) comparisons instead of
+rescoring and re-sorting every team.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+# Transfer event types
+EVENT_COMMITTED = "committed"            # player commits to to_team
+EVENT_ENTERED_PORTAL = "entered_portal"  # player leaves from_team
+EVENT_WITHDREW = "withdrew"              # player withdraws from the portal, back to from_team
+EVENT_FLIPPED = "flipped"                # commitment moves from previous_team to to_team
+
+EVENT_TYPES = [EVENT_COMMITTED, EVENT_ENTERED_PORTAL, EVENT_WITHDREW, EVENT_FLIPPED]
+
+_OFFENSIVE_POSITIONS = {"QB", "RB", "WR", "TE", "OT", "OG", "C"}
+_DEFENSIVE_POSITIONS = {"DE", "EDGE", "DT", "LB", "CB", "S"}
+
+
+def ranking_key(team: Dict) -> Tuple[float, str]:
+    """Sort key for a team row: score descending, then team name."""
+    return (-team["score"], team["team"])
+
+
+class TeamRanking:
+    """Teams ordered by score, with O(log n) rank lookups and moves."""
+
+    def __init__(self, teams: List[Dict]):
+        self._keys = sorted(ranking_key(t) for t in teams)
+        self._key_by_team = {t["team"]: ranking_key(t) for t in teams}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def rank(self, team_name: str) -> int:
+        """Get a team's 1-based rank."""
+        return bisect_left(self._keys, self._key_by_team[team_name]) + 1
+
+    def update(self, team: Dict) -> Tuple[int, int]:
+        """
+        Re-position a team after its score changed.
+
+        Returns:
+            (old_index, new_index) of the team in rank order
+        """
+        old_key = self._key_by_team[team["team"]]
+        old_index = bisect_left(self._keys, old_key)
+        del self._keys[old_index]
+
+        new_key = ranking_key(team)
+        insort(self._keys, new_key)
+        self._key_by_team[team["team"]] = new_key
+        return old_index, bisect_left(self._keys, new_key)
+
+    def teams(self) -> List[str]:
+        """Get team names in rank order."""
+        return [team for _, team in self._keys]
+
+    def copy(self) -> "TeamRanking":
+        """Independent copy (updating it leaves this ranking unchanged)."""
+        ranking = TeamRanking([])
+        ranking._keys = list(self._keys)
+        ranking._key_by_team = dict(self._key_by_team)
+        return ranking
+
+
+def _adjust_team(team: Dict, player: Dict, is_inflow: bool, sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) one player from a team row's aggregates."""
+    side = "in" if is_inflow else "out"
+    score_field = "incoming_score" if is_inflow else "outgoing_score"
+    count_field = "inflows" if is_inflow else "outflows"
+    position = player.get("position")
+
+    team[score_field] = round(team[score_field] + sign * player.get("score", 0), 2)
+    team[count_field] += sign
+    if is_inflow:
+        team["nil_spent"] = round(team["nil_spent"] + sign * player.get("value", 0), 2)
+
+    if position in _OFFENSIVE_POSITIONS:
+        team[f"offensive_{side}"] += sign
+    elif position in _DEFENSIVE_POSITIONS:
+        team[f"defensive_{side}"] += sign
+
+    team["score"] = round(team["incoming_score"] - team["outgoing_score"], 2)
+    team["offensive_net"] = team["offensive_in"] - team["offensive_out"]
+    team["defensive_net"] = team["defensive_in"] - team["defensive_out"]
+
+
+def event_changes(event: Dict) -> List[Tuple[str, bool, int]]:
+    """
+    The team-side changes a transfer event makes (see apply_transfer_event).
+
+    Returns:
+        (team name, is_inflow, sign) per change: sign 1 adds the player to
+        that side of the team, -1 removes them
+
+    Raises:
+        ValueError: If the event type is unknown
+    """
+    event_type = event.get("type")
+    changes = []
+
+    if event_type == EVENT_COMMITTED:
+        changes.append((event.get("to_team"), True, 1))
+    elif event_type == EVENT_ENTERED_PORTAL:
+        changes.append((event.get("from_team"), False, 1))
+    elif event_type == EVENT_WITHDREW:
+        changes.append((event.get("from_team"), False, -1))
+    elif event_type == EVENT_FLIPPED:
+        changes.append((event.get("previous_team"), True, -1))
+        changes.append((event.get("to_team"), True, 1))
+    else:
+        raise ValueError(f"Unknown transfer event type: {event_type}")
+    return changes
+
+
+def apply_team_changes(teams_by_name: Dict[str, Dict], changes: List[Tuple[str, bool, int, Dict]]) -> List[str]:
+    """
+    Apply team-side changes to the team rows in place.
+
+    Args:
+        teams_by_name: Team rows (as built by data.build_league_snapshot) by name
+        changes: (team name, is_inflow, sign, player) per change, as from
+            event_changes plus the player row added or removed (its
+            position, score and value are what the team gains or loses).
+            Teams outside the league are skipped.
+
+    Returns:
+        Names of the teams whose rows changed, in first-change order
+    """
+    affected = []
+    for team_name, is_inflow, sign, player in changes:
+        team = teams_by_name.get(team_name)
+        if team is None:
+            continue
+        _adjust_team(team, player, is_inflow, sign)
+        if team_name not in affected:
+            affected.append(team_name)
+    return affected
+
+
+def apply_transfer_event(teams_by_name: Dict[str, Dict], event: Dict) -> List[str]:
+    """
+    Apply one transfer event to the affected team rows in place.
+
+    The event's player is what each side gains or loses; to remove the
+    player actually on a team's list, resolve the changes against the
+    player store instead (see data.LeagueSnapshot.with_event).
+
+    Args:
+        teams_by_name: Team rows (as built by data.build_league_snapshot) by name
+        event: Dict with "type" (one of EVENT_TYPES), "player" (position,
+            score, value) and the teams involved: "from_team", "to_team",
+            and "previous_team" for flips. Teams outside the league are skipped.
+
+    Returns:
+        Names of the teams whose rows changed
+
+    Raises:
+        ValueError: If the event type is unknown
+    """
+    player = event["player"]
+    return apply_team_changes(teams_by_name, [(*change, player) for change in event_changes(event)])
+
+
+def score_data_from_team(team: Dict) -> Dict:
+    """Get the calculate_team_score fields (plus nil_spent) from a team row."""
+    return {
+        "total_score": team["score"],
+        "incoming_score": team["incoming_score"],
+        "outgoing_score": team["outgoing_score"],
+        "offensive_net": team["offensive_net"],
+        "offensive_in": team["offensive_in"],
+        "offensive_out": team["offensive_out"],
+        "defensive_net": team["defensive_net"],
+        "defensive_in": team["defensive_in"],
+        "defensive_out": team["defensive_out"],
+        "nil_spent": team["nil_spent"],
+    }
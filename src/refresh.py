@@ -0,0 +1,168 @@
+"""
+Background Refresh Worker for NIL or Nothing
+
+Runs outside the Streamlit process. Every cycle scrapes all sources,
+ranks the scraped portal and publishes the rankings with the league as a
+new snapshot version (see snapshot.publish_league_snapshot). The app only
+reads the published snapshot, so no page view waits on the network or on
+parsing.
+
+The scraped transfers carry no previous school, class or game counts, so
+the league the pages show is still the generated sample data; it is
+published with sample_data set in the manifest and labeled as such. The
+scraped portal rankings are shown on the home page, and scraped
+commitments and flips are logged as transfer events (see events.EventLog),
+which the dashboards apply at once and every published version folds in.
+
+A cycle whose league and rankings match the current version publishes
+nothing, so replicas do not reload identical data. A failed cycle leaves
+the current version in place; the next cycle tries again.
+
+Usage:
+    python -m src.refresh                  # refresh every 15 minutes until stopped
+    python -m src.refresh --once
+    python -m src.refresh --interval 300 --cache-dir data/http-cache
+"""
+
+import argparse
+import hashlib
+import signal
+import sys
+import threading
+import time
+from typing import Optional
+
+import pandas as pd
+
+from src.changes import ChangeTracker
+from src.data import SEASON, build_league_snapshot, replay_event_log
+from src.events import EventLog, change_to_event
+from src.scraper import TransferPortalScraper, calculate_team_rankings, fetch_all_data
+from src.snapshot import publish_league_snapshot, read_manifest
+
+# Seconds between the starts of two refresh cycles
+DEFAULT_INTERVAL = 15 * 60
+
+# Season whose stats and portal activity are scraped for the published SEASON
+DEFAULT_SCRAPE_YEAR = SEASON - 1
+
+
+def publish_key(snapshot) -> str:
+    """Hash of what a publish would serve: the league's transfers plus the portal rankings."""
+    digest = hashlib.blake2b(snapshot.content_key.encode("utf-8"), digest_size=16)
+    if snapshot.portal_rankings is not None:
+        digest.update(pd.util.hash_pandas_object(snapshot.portal_rankings, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def refresh_once(
+    scraper: TransferPortalScraper,
+    year: int = DEFAULT_SCRAPE_YEAR,
+    season: int = SEASON,
+    tracker: Optional[ChangeTracker] = None,
+) -> Optional[str]:
+    """
+    Run one scrape -> ranking cycle and publish the snapshot if it changed.
+
+    Args:
+        scraper: Scraper to fetch with (reused across cycles for its cache)
+        year: Season to scrape
+        season: Season the snapshot is published under
+        tracker: Change tracker to log portal changes to (Live Feed); its
+            commitments and flips are also logged as transfer events
+
+    Returns:
+        The published version name, or None when the current version
+        already serves the same data
+    """
+    data = fetch_all_data(year, scraper=scraper)
+    transfers = data['transfers']
+    if tracker is not None and not transfers.empty:
+        changes = tracker.update('247-transfers', year, transfers.to_dict('records'))
+        log = EventLog(season)
+        for event in filter(None, map(change_to_event, changes)):
+            log.append(event)
+
+    # The sample players are not the scraped ones, so they are not revalued on the scraped stats
+    snapshot, _ = replay_event_log(build_league_snapshot(), season)
+    if not transfers.empty:
+        snapshot.portal_rankings = calculate_team_rankings(transfers)
+    snapshot_key = publish_key(snapshot)
+    manifest = read_manifest(season)
+    if manifest is not None and manifest.get("publish_key") == snapshot_key:
+        return None
+
+    metadata = {"scrape_year": year, "sample_data": True, "publish_key": snapshot_key,
+                "events_applied": snapshot.events_applied,
+                **{f"{key}_rows": len(frame) for key, frame in data.items()}}
+    return publish_league_snapshot(snapshot, season, metadata=metadata)
+
+
+def run_refresh_loop(
+    scraper: TransferPortalScraper,
+    interval: float = DEFAULT_INTERVAL,
+    year: int = DEFAULT_SCRAPE_YEAR,
+    season: int = SEASON,
+    once: bool = False,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """
+    Refresh on a fixed interval until stopped.
+
+    Args:
+        scraper: Scraper to fetch with
+        interval: Seconds between cycle starts (a slow cycle starts the next at once)
+        year: Season to scrape
+        season: Season the snapshot is published under
+        once: Run a single cycle
+        stop: Event that ends the loop (checked between cycles)
+
+    Returns:
+        Number of failed cycles
+    """
+    stop = stop or threading.Event()
+    tracker = ChangeTracker()
+    failures = 0
+    while True:
+        started = time.monotonic()
+        try:
+            version = refresh_once(scraper, year, season, tracker)
+            if version is None:
+                print(f"Nothing changed, kept the current version ({time.monotonic() - started:.1f}s)")
+            else:
+                print(f"Published {version} in {time.monotonic() - started:.1f}s")
+        except Exception as e:
+            failures += 1
+            print(f"Refresh failed, keeping the current snapshot: {e}")
+
+        if once or stop.wait(max(0.0, interval - (time.monotonic() - started))):
+            return failures
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Scrape, rank and publish league snapshots on an interval.")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between refreshes")
+    parser.add_argument("--once", action="store_true", help="Refresh once and exit")
+    parser.add_argument("--year", type=int, default=DEFAULT_SCRAPE_YEAR, help="Season to scrape")
+    parser.add_argument("--season", type=int, default=SEASON, help="Season to publish under")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--replay-url", default=None)
+    parser.add_argument("--parse-workers", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    scraper = TransferPortalScraper(cache_dir=args.cache_dir, replay_url=args.replay_url,
+                                    parse_workers=args.parse_workers)
+    try:
+        failures = run_refresh_loop(scraper, args.interval, args.year, args.season, args.once, stop)
+    finally:
+        scraper.close()
+    if args.once and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
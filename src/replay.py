@@ -0,0 +1,246 @@
+"""
+Offline Record/Replay for the Transfer Portal Scraper
+
+Record mode saves the raw responses the scraper receives from 247Sports
+and ESPN into a fixture directory. Replay mode serves those fixtures from
+a local HTTP server with configurable latency and injected errors, so the
+fetch/parse pipeline can be exercised and benchmarked without network
+access.
+
+Usage:
+    python -m src.replay record --year 2025 --fixtures fixtures/2025
+    python -m src.replay serve --fixtures fixtures/2025 --port 8765 --latency 0.05
+    python -m src.replay bench --fixtures fixtures/2025 --year 2025 --error-rate 0.05 --parse-workers 4
+
+A replaying scraper requests http://127.0.0.1:<port>/<host>/<path>?<query>
+for every https://<host>/<path>?<query> it would normally fetch.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+MANIFEST_FILE = "manifest.json"
+
+
+def fixture_key(url: str) -> str:
+    """Scheme-less key for a URL: host + path + query."""
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+
+def replay_url_rewriter(replay_url: str):
+    """Get a function mapping live URLs onto a replay server at replay_url."""
+    base = replay_url.rstrip("/")
+    return lambda url: f"{base}/{fixture_key(url)}"
+
+
+class FixtureRecorder:
+    """Saves raw responses to a fixture directory, keyed by URL."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        (self.directory / "bodies").mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._manifest = _load_manifest(self.directory)
+
+    def record(self, url: str, response: requests.Response) -> None:
+        """Store a response body and status under the URL's fixture key."""
+        body = response.content
+        body_file = f"bodies/{hashlib.sha256(body).hexdigest()}"
+        (self.directory / body_file).write_bytes(body)
+
+        with self._lock:
+            self._manifest[fixture_key(url)] = {
+                "status": response.status_code,
+                "content_type": response.headers.get("Content-Type", "text/html"),
+                "body": body_file,
+            }
+            (self.directory / MANIFEST_FILE).write_text(json.dumps(self._manifest, indent=1, sort_keys=True))
+
+
+def _load_manifest(directory: Path) -> Dict[str, Dict]:
+    try:
+        return json.loads((directory / MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+class ReplayServer:
+    """
+    Local HTTP stand-in serving recorded fixtures.
+
+    Args:
+        directory: Fixture directory written by FixtureRecorder
+        port: Port to listen on (0 = pick a free one)
+        latency: Seconds to wait before each response
+        error_rate: Fraction of requests answered with error_status
+        error_status: HTTP status used for injected errors
+        seed: Seed for the error injection RNG (for reproducible runs)
+    """
+
+    def __init__(
+        self,
+        directory,
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ):
+        self.directory = Path(directory)
+        self.manifest = _load_manifest(self.directory)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _inject_error(self) -> bool:
+        with self._rng_lock:
+            self.requests_served += 1
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.errors_injected += 1
+                return True
+            return False
+
+    def _handler_class(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if replay.latency:
+                    time.sleep(replay.latency)
+                if replay._inject_error():
+                    self._send(replay.error_status, b"injected error", "text/plain")
+                    return
+
+                fixture = replay.manifest.get(self.path.lstrip("/"))
+                if fixture is None:
+                    self._send(404, b"no fixture recorded", "text/plain")
+                    return
+                body = (replay.directory / fixture["body"]).read_bytes()
+                self._send(fixture["status"], body, fixture["content_type"])
+
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "ReplayServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def _count_rows(data: Dict) -> int:
+    return sum(len(df) for df in data.values())
+
+
+def main(argv=None) -> None:
+    from src.fetch import RetryPolicy
+    from src.scraper import TransferPortalScraper, fetch_all_data
+
+    parser = argparse.ArgumentParser(description="Record and replay scraper traffic.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="Fetch live pages and save them as fixtures")
+    record.add_argument("--year", type=int, default=2025)
+    record.add_argument("--fixtures", required=True)
+
+    for name, help_text in (("serve", "Serve fixtures until interrupted"),
+                            ("bench", "Time a full fetch_all_data run against the fixtures")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("--fixtures", required=True)
+        cmd.add_argument("--port", type=int, default=0 if name == "bench" else 8765)
+        cmd.add_argument("--latency", type=float, default=0.0)
+        cmd.add_argument("--error-rate", type=float, default=0.0)
+        cmd.add_argument("--seed", type=int, default=0)
+        if name == "bench":
+            cmd.add_argument("--year", type=int, default=2025)
+            cmd.add_argument("--runs", type=int, default=3)
+            cmd.add_argument("--parse-workers", type=int, default=0)
+            cmd.add_argument("--retries", type=int, default=3)
+            cmd.add_argument("--backoff", type=float, default=0.05)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        scraper = TransferPortalScraper(record_dir=args.fixtures)
+        data = fetch_all_data(args.year, scraper=scraper)
+        print(f"Recorded {_count_rows(data)} rows into {args.fixtures}")
+        return
+
+    server = ReplayServer(args.fixtures, port=args.port, latency=args.latency,
+                          error_rate=args.error_rate, seed=args.seed)
+
+    if args.command == "serve":
+        print(f"Replaying {len(server.manifest)} fixtures at {server.url}")
+        server.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.stop()
+        return
+
+    with server:
+        for run in range(1, args.runs + 1):
+            # No rate limiting for the local server - measure the pipeline itself
+            scraper = TransferPortalScraper(
+                replay_url=server.url,
+                parse_workers=args.parse_workers,
+                retry=RetryPolicy(retries=args.retries, backoff=args.backoff, rng=random.Random(args.seed)),
+                rate_limits={host: (1e6, 1000) for host in {key.split("/", 1)[0] for key in server.manifest}},
+            )
+            served_before = server.requests_served
+            start = time.perf_counter()
+            data = fetch_all_data(args.year, scraper=scraper)
+            elapsed = time.perf_counter() - start
+            scraper.close()
+            requests_made = server.requests_served - served_before
+            print(f"run {run}: {elapsed:.3f}s, {requests_made} requests "
+                  f"({requests_made / elapsed:.1f} req/s), {_count_rows(data)} rows")
+        print(f"errors injected: {server.errors_injected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,23 +7,151 @@ This module handles fetching transfer portal data from various sources:
 - ESPN College Football Stats (player performance stats)
 """
 
+import queue
+import re
+import threading
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-from typing import Optional, List, Dict
-import time
-import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Callable, Iterable, Iterator, Optional, List, Dict, Tuple, Union
+
+from src.fetch import FetchEngine, RetryPolicy, is_not_found
+from src.http_cache import ResponseCache
+from src.parsers import parse_247_transfer_page, parse_espn_page, parse_recruit_page
+from src.pipeline import FetchParsePipeline
+from src.replay import FixtureRecorder, replay_url_rewriter
+from src.teams import NO_TEAM, REGISTRY, canonicalize_teams
+from src.valuation import POSITION_MULTIPLIERS, get_class_weight
+from src.watermark import WatermarkStore, row_fingerprint
+
+# Bump when row parsing changes so cached parse results are not reused
+PARSER_VERSION = 3
+
+# Pages requested ahead of the one being read during incremental scrapes
+INCREMENTAL_PREFETCH = 1
+
+ESPN_STAT_TYPES = ['passing', 'rushing', 'receiving', 'tackles', 'sacks', 'interceptions']
+
+# Stat table pages fetched per ESPN category by default
+ESPN_MAX_PAGES = 3
+
+# Transfer statuses that count toward the destination team's ranking
+COMMITTED_STATUS = re.compile('committed|enrolled', re.IGNORECASE)
+
+
+def transfer_portal_url(year: int, page: int = 1) -> str:
+    """URL of one 247Sports transfer portal page."""
+    base_url = f"https://247sports.com/Season/{year}-Football/TransferPortal/"
+    return f"{base_url}?page={page}" if page > 1 else base_url
+
+
+def recruit_rankings_url(year: int, page: int = 1) -> str:
+    """URL of one 247Sports recruit rankings page."""
+    base_url = f"https://247sports.com/season/{year}-football/recruitrankings/"
+    return f"{base_url}?page={page}" if page > 1 else base_url
+
+
+def espn_stats_url(year: int, stat_type: str, page: int = 1) -> str:
+    """URL of an ESPN regular-season player stats page (stat_type in ESPN_STAT_TYPES)."""
+    base_url = f'https://www.espn.com/college-football/stats/player/_/stat/{stat_type}/season/{year}/seasontype/2'
+    # Pagination format may need adjustment
+    return f'{base_url}/page/{page}' if page > 1 else base_url
 
 
 class TransferPortalScraper:
     """Scraper for college football transfer portal data."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        max_workers: int = 8,
+        cache_dir: Optional[str] = None,
+        record_dir: Optional[str] = None,
+        replay_url: Optional[str] = None,
+        parse_workers: int = 0,
+        watermark_dir: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+    ):
+        """
+        Args:
+            rate_limits: Per-host (requests per second, burst) overrides,
+                e.g. {"247sports.com": (1.0, 2)}
+            max_workers: Maximum concurrent requests across all hosts
+            cache_dir: Directory for the on-disk response cache (None = no cache)
+            record_dir: Save every raw response here as a replay fixture
+            replay_url: Send requests to a replay.ReplayServer at this URL
+                instead of the live sites
+            parse_workers: Worker processes parsing pages while later pages
+                download (0 = parse in the calling thread)
+            watermark_dir: Directory for per-source, per-season watermarks.
+                When set, scrapes are incremental: only new or changed rows
+                are returned and paging stops at the first fully-known page.
+            retry: Backoff policy for transient request failures
+                (default fetch.RetryPolicy(): 3 retries from 0.5s)
+        """
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.fetcher = FetchEngine(
+            self.session,
+            rate_limits=rate_limits,
+            max_workers=max_workers,
+            cache=self.cache,
+            url_rewriter=replay_url_rewriter(replay_url) if replay_url else None,
+            recorder=FixtureRecorder(record_dir) if record_dir else None,
+            retry=retry,
+        )
+        self.pipeline = FetchParsePipeline(self.fetcher, self.cache, parse_workers=parse_workers)
+        self.watermarks = WatermarkStore(watermark_dir) if watermark_dir else None
+
+    def close(self) -> None:
+        """Stop the fetch threads and parse worker processes."""
+        self.pipeline.shutdown()
+        self.fetcher.shutdown()
+
+    def _iter_pages(
+        self, source: str, year: int, urls: List[str], parser: str, parse_fn: Callable, *args
+    ) -> Iterator[Tuple[int, Union[List[Dict], Exception]]]:
+        """
+        Fetch and parse pages, yielding (page number, rows or exception).
+
+        Without watermarks every page is yielded as parsed. With them, rows
+        seen in an earlier run are dropped, paging stops at the first page
+        with no new rows, and only the next page is fetched ahead. The
+        watermark advances when the caller finishes reading or closes the
+        generator early (e.g. after a failed page), so rows it received are
+        not returned again.
+        """
+        if self.watermarks is None:
+            results = self.pipeline.run(urls, parser, parse_fn, *args)
+            for page, (url, rows) in enumerate(results, start=1):
+                yield page, rows
+            return
+
+        known = self.watermarks.load(source, year)
+        seen = set()
+        results = self.pipeline.run(urls, parser, parse_fn, *args, window=INCREMENTAL_PREFETCH if known else None)
+        try:
+            for page, (url, rows) in enumerate(results, start=1):
+                if isinstance(rows, Exception):
+                    yield page, rows
+                    break
+
+                fingerprints = [row_fingerprint(row) for row in rows]
+                seen.update(fingerprints)
+                new_rows = [row for row, fp in zip(rows, fingerprints) if fp not in known]
+                if rows and not new_rows:
+                    break
+                yield page, new_rows
+        finally:
+            # Runs when the caller stops early (e.g. breaks on a failed page)
+            if seen - known:
+                self.watermarks.save(source, year, known | seen)
 
     def get_247_transfer_portal(self, year: int = 2025, max_pages: int = 5) -> pd.DataFrame:
         """
@@ -39,68 +167,42 @@ class TransferPortalScraper:
         Returns:
             DataFrame with transfer portal entries
         """
-        base_url = f"https://247sports.com/Season/{year}-Football/TransferPortal/"
-        all_players = []
-
-        for page in range(1, max_pages + 1):
-            try:
-                url = f"{base_url}?page={page}" if page > 1 else base_url
-                response = self.session.get(url, timeout=10)
-
-                if response.status_code != 200:
-                    print(f"Failed to fetch page {page}: {response.status_code}")
-                    break
-
-                soup = BeautifulSoup(response.text, 'lxml')
+        return _concat_batches(self.iter_247_transfer_portal(year, max_pages))
 
-                # Find player entries - adjust selectors based on actual page structure
-                player_rows = soup.select('.transfer-portal-row, .player-row, li.rankings-page__list-item')
-
-                for row in player_rows:
-                    player = self._parse_247_player(row)
-                    if player:
-                        all_players.append(player)
-
-                # Be respectful - don't hammer the server
-                time.sleep(1)
+    def iter_247_transfer_portal(self, year: int = 2025, max_pages: int = 5) -> Iterator[pd.DataFrame]:
+        """
+        Stream transfer portal data from 247Sports one page at a time.
 
-            except Exception as e:
-                print(f"Error fetching page {page}: {e}")
-                break
+        Same data as get_247_transfer_portal, but each page's players are
+        yielded as soon as the page is parsed, while later pages are still
+        downloading. With watermarks, only new or changed players are
+        yielded (see _iter_pages).
 
-        return pd.DataFrame(all_players)
+        Args:
+            year: The recruiting year (e.g., 2025)
+            max_pages: Maximum number of pages to scrape (25 players per page)
 
-    def _parse_247_player(self, row) -> Optional[Dict]:
-        """Parse a single player row from 247Sports."""
-        try:
-            # Extract player info - selectors may need adjustment
-            name_elem = row.select_one('.name, .player-name, a.rankings-page__name-link')
-            rating_elem = row.select_one('.rating, .score, .rankings-page__star-and-score')
-            position_elem = row.select_one('.position, .pos')
-            status_elem = row.select_one('.status, .transfer-status')
-
-            player = {
-                'name': name_elem.get_text(strip=True) if name_elem else None,
-                'rating': self._extract_rating(rating_elem),
-                'position': position_elem.get_text(strip=True) if position_elem else None,
-                'status': status_elem.get_text(strip=True) if status_elem else None,
-                'source': '247Sports'
-            }
-
-            # Only return if we got at least a name
-            return player if player['name'] else None
+        Yields:
+            DataFrame of the players on each non-empty page, in page order
+        """
+        urls = [transfer_portal_url(year, page) for page in range(1, max_pages + 1)]
+
+        # Pages download concurrently (rate-limited per host) and are parsed
+        # as they arrive; stop at the first failure. closing() settles the
+        # watermark as soon as we stop reading, not when the generator is collected
+        with closing(self._iter_pages('247-transfers', year, urls, f'247-transfers-v{PARSER_VERSION}',
+                                      parse_247_transfer_page)) as results:
+            for page, players in results:
+                if isinstance(players, requests.HTTPError):
+                    print(f"Failed to fetch page {page}: {players}")
+                    break
 
-        except Exception as e:
-            return None
+                if isinstance(players, Exception):
+                    print(f"Error fetching page {page}: {players}")
+                    break
 
-    def _extract_rating(self, elem) -> Optional[float]:
-        """Extract numeric rating from element."""
-        if not elem:
-            return None
-        text = elem.get_text(strip=True)
-        # Look for decimal ratings like 0.9842 or 94.2
-        match = re.search(r'(\d+\.?\d*)', text)
-        return float(match.group(1)) if match else None
+                if players:
+                    yield canonicalize_teams(pd.DataFrame(players), 'destination')
 
     def get_247_recruit_rankings(self, year: int = 2027, max_pages: int = 5) -> pd.DataFrame:
         """
@@ -115,54 +217,33 @@ class TransferPortalScraper:
         Returns:
             DataFrame with recruit rankings
         """
-        base_url = f"https://247sports.com/season/{year}-football/recruitrankings/"
-        all_recruits = []
-
-        for page in range(1, max_pages + 1):
-            try:
-                url = f"{base_url}?page={page}" if page > 1 else base_url
-                response = self.session.get(url, timeout=10)
-
-                if response.status_code != 200:
-                    break
-
-                soup = BeautifulSoup(response.text, 'lxml')
+        return _concat_batches(self.iter_247_recruit_rankings(year, max_pages))
 
-                # Parse recruit rows
-                recruit_rows = soup.select('li.rankings-page__list-item')
+    def iter_247_recruit_rankings(self, year: int = 2027, max_pages: int = 5) -> Iterator[pd.DataFrame]:
+        """
+        Stream high school recruit rankings from 247Sports one page at a time.
 
-                for row in recruit_rows:
-                    recruit = self._parse_recruit(row)
-                    if recruit:
-                        all_recruits.append(recruit)
+        Args:
+            year: The recruiting class year
+            max_pages: Maximum pages to fetch
 
-                time.sleep(1)
+        Yields:
+            DataFrame of the recruits on each non-empty page, in page order
+        """
+        urls = [recruit_rankings_url(year, page) for page in range(1, max_pages + 1)]
 
-            except Exception as e:
-                print(f"Error fetching recruits page {page}: {e}")
-                break
+        with closing(self._iter_pages('247-recruits', year, urls, f'247-recruits-v{PARSER_VERSION}',
+                                      parse_recruit_page)) as results:
+            for page, recruits in results:
+                if isinstance(recruits, requests.HTTPError):
+                    break
 
-        return pd.DataFrame(all_recruits)
+                if isinstance(recruits, Exception):
+                    print(f"Error fetching recruits page {page}: {recruits}")
+                    break
 
-    def _parse_recruit(self, row) -> Optional[Dict]:
-        """Parse a single recruit row."""
-        try:
-            name_elem = row.select_one('.rankings-page__name-link')
-            rating_elem = row.select_one('.rankings-page__star-and-score')
-            position_elem = row.select_one('.position')
-            school_elem = row.select_one('.rankings-page__school')
-            commit_elem = row.select_one('.rankings-page__commitment')
-
-            return {
-                'name': name_elem.get_text(strip=True) if name_elem else None,
-                'rating': self._extract_rating(rating_elem),
-                'position': position_elem.get_text(strip=True) if position_elem else None,
-                'high_school': school_elem.get_text(strip=True) if school_elem else None,
-                'committed_to': commit_elem.get_text(strip=True) if commit_elem else None,
-                'source': '247Sports'
-            }
-        except Exception:
-            return None
+                if recruits:
+                    yield canonicalize_teams(pd.DataFrame(recruits), 'committed_to')
 
     def get_espn_stats(self, year: int = 2025, stat_type: str = 'passing') -> pd.DataFrame:
         """
@@ -175,50 +256,134 @@ class TransferPortalScraper:
         Returns:
             DataFrame with player stats
         """
-        stat_urls = {
-            'passing': f'https://www.espn.com/college-football/stats/player/_/stat/passing/season/{year}/seasontype/2',
-            'rushing': f'https://www.espn.com/college-football/stats/player/_/stat/rushing/season/{year}/seasontype/2',
-            'receiving': f'https://www.espn.com/college-football/stats/player/_/stat/receiving/season/{year}/seasontype/2',
-            'tackles': f'https://www.espn.com/college-football/stats/player/_/stat/tackles/season/{year}/seasontype/2',
-            'sacks': f'https://www.espn.com/college-football/stats/player/_/stat/sacks/season/{year}/seasontype/2',
-            'interceptions': f'https://www.espn.com/college-football/stats/player/_/stat/interceptions/season/{year}/seasontype/2',
-        }
+        return _concat_batches(self.iter_espn_stats(year, stat_type))
 
-        url = stat_urls.get(stat_type)
-        if not url:
-            return pd.DataFrame()
+    def iter_espn_stats(self, year: int = 2025, stat_type: str = 'passing', max_pages: int = 1) -> Iterator[pd.DataFrame]:
+        """
+        Stream player stats from ESPN one page at a time.
 
-        try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.text, 'lxml')
-
-            # ESPN uses tables for stats
-            tables = soup.select('table')
-
-            players = []
-            # Parse table rows - ESPN structure varies, may need adjustment
-            for table in tables:
-                rows = table.select('tr')
-                for row in rows[1:]:  # Skip header
-                    cells = row.select('td')
-                    if len(cells) >= 2:
-                        players.append({
-                            'name': cells[0].get_text(strip=True),
-                            'team': cells[1].get_text(strip=True) if len(cells) > 1 else None,
-                            'stat_value': cells[2].get_text(strip=True) if len(cells) > 2 else None,
-                            'stat_type': stat_type,
-                            'year': year,
-                            'source': 'ESPN'
-                        })
-
-            return pd.DataFrame(players)
+        Args:
+            year: Season year
+            stat_type: One of 'passing', 'rushing', 'receiving', 'tackles', 'sacks', 'interceptions'
+            max_pages: Maximum pages of the stat table to fetch
+
+        Yields:
+            DataFrame of the players on each non-empty page
+        """
+        if stat_type not in ESPN_STAT_TYPES:
+            return
+        urls = [espn_stats_url(year, stat_type, page) for page in range(1, max_pages + 1)]
+        parser = f'espn-{stat_type}-{year}-v{PARSER_VERSION}'
+        with closing(self._iter_pages(f'espn-{stat_type}', year, urls, parser,
+                                      parse_espn_page, stat_type, year)) as results:
+            for page, players in results:
+                if page > 1 and is_not_found(players):
+                    return  # Past the last page
+                if isinstance(players, Exception):
+                    print(f"Error fetching ESPN stats: {players}")
+                    return
+                if not players:
+                    return
+                yield canonicalize_teams(pd.DataFrame(players), 'team')
+
+    def get_espn_stats_wide(
+        self, year: int = 2025, stat_types: Optional[List[str]] = None, max_pages: int = ESPN_MAX_PAGES
+    ) -> pd.DataFrame:
+        """
+        Fetch every ESPN stat category at once as one row per player.
+
+        All categories and their pages download concurrently (within the
+        per-host rate limit); see espn_stats_wide for the result layout.
+
+        Args:
+            year: Season year
+            stat_types: Categories to fetch (default: all of ESPN_STAT_TYPES)
+            max_pages: Maximum pages per category
+
+        Returns:
+            Wide stats DataFrame keyed by name + team + season
+        """
+        stat_types = stat_types or ESPN_STAT_TYPES
+        with ThreadPoolExecutor(max_workers=len(stat_types)) as executor:
+            frames = list(executor.map(
+                lambda stat_type: _concat_batches(self.iter_espn_stats(year, stat_type, max_pages)), stat_types
+            ))
+        return espn_stats_wide(frames, stat_types)
+
+
+def _concat_batches(batches: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Join per-page batches into one DataFrame (empty if there were none)."""
+    batches = [batch for batch in batches if not batch.empty]
+    if not batches:
+        return pd.DataFrame()
+    return pd.concat(batches, ignore_index=True)
 
-        except Exception as e:
-            print(f"Error fetching ESPN stats: {e}")
-            return pd.DataFrame()
 
+def espn_stats_wide(frames: Iterable[pd.DataFrame], stat_types: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Merge long ESPN stat frames (one row per player per category) into one wide frame.
+
+    Stat strings like "3,456" are parsed to numbers once here. A player
+    listed twice in a category (e.g. on two pages) keeps the first value.
+
+    Args:
+        frames: Frames from get_espn_stats / iter_espn_stats
+        stat_types: Columns to guarantee in the result (default: ESPN_STAT_TYPES)
+
+    Returns:
+        DataFrame with name, canonical team (category), season (int16),
+        team_id (int32, see teams.REGISTRY) and one float column per stat
+        type (NaN where a player has no entry), unique on (name, team, season)
+    """
+    stat_types = stat_types or ESPN_STAT_TYPES
+    key = ['name', 'team', 'season']
+    long = _concat_batches(frames)
+    if long.empty:
+        return pd.DataFrame({col: pd.Series(dtype='float64') for col in key + ['team_id'] + stat_types}).astype(
+            {'name': 'object', 'team': 'category', 'season': 'int16', 'team_id': 'int32'})
+
+    long = long.rename(columns={'year': 'season'})
+    if 'team_id' not in long.columns:
+        canonicalize_teams(long, 'team')
+    key = key + ['team_id']  # One ID per canonical team, so still unique on the key above
+    long['value'] = pd.to_numeric(
+        long['stat_value'].astype('string').str.replace(',', '', regex=False), errors='coerce'
+    )
+    wide = (
+        long.drop_duplicates(key + ['stat_type'])
+        .pivot(index=key, columns='stat_type', values='value')
+        .reindex(columns=stat_types)
+        .reset_index()
+    )
+    wide.columns.name = None
+    return wide.astype({'team': 'category', 'season': 'int16', 'team_id': 'int32',
+                        **{col: 'float64' for col in stat_types}})
 
-def calculate_team_rankings(transfers_df: pd.DataFrame) -> pd.DataFrame:
+
+def _per_value(column: pd.Series, fn: Callable, dtype) -> np.ndarray:
+    """
+    Evaluate fn once per distinct value of a column and broadcast to its rows.
+
+    Categorical columns reuse their codes; other columns are factorized.
+    Missing values get fn(None).
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes, uniques = column.cat.codes.to_numpy(), column.cat.categories
+    else:
+        codes, uniques = pd.factorize(column)
+    table = np.array([fn(value) for value in uniques] + [fn(None)], dtype=dtype)
+    return table[codes]  # code -1 (missing) picks the trailing fn(None)
+
+
+def _is_committed_status(status: Optional[str]) -> bool:
+    return bool(status) and bool(COMMITTED_STATUS.search(status))
+
+
+# Columns of calculate_team_rankings that can order a ranking
+RANKING_SCHEMES = ['Score', 'Weighted_Score', 'Transfers', 'Avg_Rating', 'Total_Rating']
+
+
+def calculate_team_rankings(transfers_df: pd.DataFrame, by: str = 'Score') -> pd.DataFrame:
     """
     Calculate team rankings based on transfer portal activity.
 
@@ -226,28 +391,63 @@ def calculate_team_rankings(transfers_df: pd.DataFrame) -> pd.DataFrame:
     - Number of transfers acquired
     - Average rating of acquired transfers
     - Total "value" (sum of ratings)
+    - Position/class-weighted value (ratings scaled by the valuation's
+      POSITION_MULTIPLIERS and, when the frame has player_class, CLASS_WEIGHTS)
+
+    Every scheme comes out of one grouped pass: the status and position
+    columns are evaluated once per distinct value (categorical columns
+    directly from their codes), rows are grouped on the integer
+    destination_id (plus season, for multi-season frames) and the sums are
+    single np.bincount calls.
 
     Args:
         transfers_df: DataFrame with transfer portal data
+        by: Ranking scheme, one of RANKING_SCHEMES
 
     Returns:
-        DataFrame with team rankings
+        DataFrame with team rankings (Team is the canonical name, Team_ID
+        its teams.REGISTRY ID); frames with a season column are ranked
+        within each season, with a Season column first
     """
     if transfers_df.empty:
         return pd.DataFrame()
-
-    # Filter to committed/enrolled players with a destination
-    committed = transfers_df[
-        transfers_df['status'].str.contains('Committed|Enrolled', case=False, na=False)
-    ]
-
-    # Group by destination team
-    team_stats = committed.groupby('destination').agg({
-        'name': 'count',
-        'rating': ['mean', 'sum']
-    }).reset_index()
-
-    team_stats.columns = ['Team', 'Transfers', 'Avg_Rating', 'Total_Rating']
+    if by not in RANKING_SCHEMES:
+        raise ValueError(f"Unknown ranking scheme: {by}")
+
+    # Frames scraped here already carry destination_id; others are normalized now
+    if 'destination_id' not in transfers_df.columns:
+        transfers_df = transfers_df.assign(destination_id=REGISTRY.ids(transfers_df['destination']))
+
+    # Committed/enrolled players with a destination
+    team_ids = transfers_df['destination_id'].to_numpy()
+    committed = _per_value(transfers_df['status'], _is_committed_status, bool) & (team_ids != NO_TEAM)
+
+    rating = transfers_df['rating'].to_numpy(dtype=float)[committed]
+    has_rating = ~np.isnan(rating)
+    rating = np.where(has_rating, rating, 0.0)
+    weight = _per_value(transfers_df['position'], lambda pos: POSITION_MULTIPLIERS.get(pos, 1.0), float)
+    if 'player_class' in transfers_df.columns:
+        weight = weight * _per_value(transfers_df['player_class'], get_class_weight, float)
+    weighted = rating * weight[committed]
+
+    # Group on destination (and season): one factorize of an integer key
+    key = team_ids[committed].astype(np.int64)
+    multi_season = 'season' in transfers_df.columns
+    if multi_season:
+        key = key + transfers_df['season'].to_numpy(dtype=np.int64)[committed] * (1 << 32)
+    groups, group_keys = pd.factorize(key, sort=True)
+    n_groups = len(group_keys)
+
+    rated = np.bincount(groups, weights=has_rating, minlength=n_groups)
+    total = np.bincount(groups, weights=rating, minlength=n_groups)
+    team_stats = pd.DataFrame({
+        'Team_ID': (group_keys & 0xFFFFFFFF).astype(np.int32),
+        'Transfers': np.bincount(groups, minlength=n_groups),
+        'Avg_Rating': np.divide(total, rated, out=np.full(n_groups, np.nan), where=rated > 0),
+        'Total_Rating': total,
+        'Weighted_Score': np.bincount(groups, weights=weighted, minlength=n_groups),
+    })
+    team_stats.insert(0, 'Team', REGISTRY.names(team_stats['Team_ID']))
 
     # Calculate composite score for ranking
     team_stats['Score'] = (
@@ -256,28 +456,142 @@ def calculate_team_rankings(transfers_df: pd.DataFrame) -> pd.DataFrame:
         team_stats['Total_Rating'] * 0.3
     )
 
-    # Rank teams
-    team_stats = team_stats.sort_values('Score', ascending=False).reset_index(drop=True)
-    team_stats['Rank'] = range(1, len(team_stats) + 1)
+    # Rank teams (within each season)
+    columns = ['Rank', 'Team', 'Team_ID', 'Transfers', 'Avg_Rating', 'Total_Rating', 'Weighted_Score', 'Score']
+    if multi_season:
+        team_stats.insert(0, 'Season', (group_keys >> 32).astype(np.int16))
+        team_stats = team_stats.sort_values(['Season', by, 'Team'], ascending=[True, False, True],
+                                            kind='stable').reset_index(drop=True)
+        team_stats['Rank'] = team_stats.groupby('Season').cumcount() + 1
+        columns.insert(0, 'Season')
+    else:
+        team_stats = team_stats.sort_values([by, 'Team'], ascending=[False, True],
+                                            kind='stable').reset_index(drop=True)
+        team_stats['Rank'] = range(1, len(team_stats) + 1)
+
+    return team_stats[columns]
+
+
+def _data_sources(scraper: TransferPortalScraper, year: int) -> Dict[str, Tuple[Callable, Dict]]:
+    """Batch iterators making up a full data fetch, keyed by result name."""
+    return {
+        'transfers': (scraper.iter_247_transfer_portal, {'year': year}),
+        'recruits': (scraper.iter_247_recruit_rankings, {'year': year}),
+        **{
+            stat_type: (scraper.iter_espn_stats, {'year': year, 'stat_type': stat_type, 'max_pages': ESPN_MAX_PAGES})
+            for stat_type in ESPN_STAT_TYPES
+        },
+    }
 
-    return team_stats[['Rank', 'Team', 'Transfers', 'Avg_Rating', 'Total_Rating', 'Score']]
+
+def iter_all_data(
+    year: int = 2025,
+    cache_dir: Optional[str] = None,
+    scraper: Optional[TransferPortalScraper] = None,
+    max_pending: int = 8,
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Stream all available data for a given year as (source key, batch) pairs.
+
+    Every source is scraped at once and batches are yielded in arrival
+    order, so callers can value, rank or store each page while the rest
+    are still downloading. At most max_pending batches wait for the caller;
+    beyond that the scraping threads block, keeping memory bounded.
+
+    Args:
+        year: Season year
+        cache_dir: Optional on-disk response cache, reused across runs
+        scraper: Preconfigured scraper; cache_dir is ignored when given
+        max_pending: Batches buffered ahead of the caller
+
+    Raises:
+        The first exception a source raised, once it reaches the caller
+        (the remaining sources are stopped), so a failed source never
+        looks like a complete one
+    """
+    owns_scraper = scraper is None
+    scraper = scraper or TransferPortalScraper(cache_dir=cache_dir)
+    sources = _data_sources(scraper, year)
+    batches: "queue.Queue[Tuple[str, Union[pd.DataFrame, Exception, None]]]" = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def post(item: Tuple[str, Union[pd.DataFrame, Exception, None]]) -> bool:
+        """Queue an item for the consumer; False once the consumer has gone away."""
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(key: str, method: Callable, kwargs: Dict) -> None:
+        try:
+            for batch in method(**kwargs):
+                if not post((key, batch)):
+                    return
+        except Exception as e:
+            # Handed to the consumer, which re-raises it
+            post((key, e))
+            return
+        # None marks a finished source
+        post((key, None))
+
+    executor = ThreadPoolExecutor(max_workers=len(sources))
+    try:
+        for key, (method, kwargs) in sources.items():
+            executor.submit(produce, key, method, kwargs)
+
+        remaining = len(sources)
+        while remaining:
+            key, batch = batches.get()
+            if batch is None:
+                remaining -= 1
+            elif isinstance(batch, Exception):
+                raise batch
+            else:
+                yield key, batch
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+        if owns_scraper:
+            scraper.close()
 
 
 # Convenience function for quick data fetch
-def fetch_all_data(year: int = 2025) -> Dict[str, pd.DataFrame]:
+def fetch_all_data(
+    year: int = 2025,
+    cache_dir: Optional[str] = None,
+    scraper: Optional[TransferPortalScraper] = None,
+) -> Dict[str, pd.DataFrame]:
     """
     Fetch all available data for a given year.
 
-    Returns dict with keys: 'transfers', 'recruits', 'passing', 'rushing', etc.
+    Args:
+        year: Season year
+        cache_dir: Optional on-disk response cache, reused across runs
+        scraper: Preconfigured scraper (e.g. in record or replay mode);
+            cache_dir is ignored when given
+
+    Returns dict with keys: 'transfers', 'recruits' and 'stats' (every ESPN
+    category merged by espn_stats_wide).
     """
-    scraper = TransferPortalScraper()
-
-    data = {
-        'transfers': scraper.get_247_transfer_portal(year=year),
-        'recruits': scraper.get_247_recruit_rankings(year=year),
-        'passing': scraper.get_espn_stats(year=year, stat_type='passing'),
-        'rushing': scraper.get_espn_stats(year=year, stat_type='rushing'),
-        'receiving': scraper.get_espn_stats(year=year, stat_type='receiving'),
-    }
+    owns_scraper = scraper is None
+    scraper = scraper or TransferPortalScraper(cache_dir=cache_dir)
+
+    # Every source runs at once; the scraper's per-host rate limits keep
+    # each site polite, so the total is roughly the slowest host's time
+    sources = _data_sources(scraper, year)
+
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {
+            key: executor.submit(lambda m=method, kw=kwargs: _concat_batches(m(**kw)))
+            for key, (method, kwargs) in sources.items()
+        }
+        data = {key: future.result() for key, future in futures.items()}
+
+    data['stats'] = espn_stats_wide([data.pop(stat_type) for stat_type in ESPN_STAT_TYPES])
 
+    if owns_scraper:
+        scraper.close()
     return data
@@ -0,0 +1,271 @@
+"""
+On-disk League Snapshots for NIL or Nothing
+
+Persists a computed LeagueSnapshot (team rows and the columnar player
+store) as Arrow IPC files and loads them back through a memory map, so
+a cold start is a file open rather than a full league rebuild, and
+Streamlit workers on the same host share the mapped pages.
+
+Value breakdowns are not written: they are derived per player from the
+stored inputs (see data.get_value_breakdown).
+
+Both files of a snapshot are written into a private temp directory that
+is renamed into place in one step, so concurrent cold starts never share
+a temp file and readers never load players and teams from different
+builds. The local snapshot's directory name includes a hash of the code
+that builds the league, so editing valuation constants or sample
+generation is picked up without clearing data/ by hand.
+
+The refresh worker (src.refresh) publishes snapshots as timestamped
+versions: each is written to a temp directory, renamed into place, and
+only then made current by atomically replacing the season's
+manifest.json. Readers follow the manifest, so they see either the old
+or the new version, never a mix, and can spot a new version with one
+stat() of the manifest.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+
+# Bump when the on-disk layout changes; older files are ignored and rebuilt
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Where snapshots are written (override with NIL_DATA_DIR)
+DATA_DIR = Path(os.environ.get("NIL_DATA_DIR", Path(__file__).resolve().parent.parent / "data"))
+
+PLAYERS_FILE = "players.arrow"
+TEAMS_FILE = "teams.arrow"
+RANKINGS_FILE = "rankings.arrow"
+
+# Published snapshot versions (see publish_league_snapshot)
+PUBLISHED_DIR = DATA_DIR / "published"
+MANIFEST_FILE = "manifest.json"
+
+# Published versions kept per season, current included
+KEEP_VERSIONS = 3
+
+# Modules whose code and constants determine the locally built league
+LEAGUE_SOURCES = ("data.py", "valuation.py", "ranking.py")
+
+
+@functools.lru_cache(maxsize=None)
+def league_config_hash() -> str:
+    """Short hash of the league-building modules' source (see LEAGUE_SOURCES)."""
+    digest = hashlib.sha256()
+    for name in LEAGUE_SOURCES:
+        digest.update((Path(__file__).resolve().parent / name).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def league_snapshot_path(season: int) -> Path:
+    """Get the snapshot directory for a season at the current format version and league code."""
+    return DATA_DIR / f"league-{season}-v{SNAPSHOT_FORMAT_VERSION}-{league_config_hash()}"
+
+
+def _write_table(table: pa.Table, path: Path) -> None:
+    """Write an Arrow IPC file."""
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_table(path: Path) -> pa.Table:
+    """Read an Arrow IPC file through a memory map."""
+    source = pa.memory_map(str(path), "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def write_league_snapshot(snapshot, path: Path) -> None:
+    """
+    Write a LeagueSnapshot to a snapshot directory.
+
+    The files are written into a uniquely named hidden temp directory next
+    to `path`, which is then renamed to `path`. An existing directory there
+    (e.g. one a concurrent worker just wrote, or an unreadable old one) is
+    replaced whole.
+
+    Args:
+        snapshot: The LeagueSnapshot to persist
+        path: Snapshot directory (parents created if missing)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    metadata = {"format_version": str(SNAPSHOT_FORMAT_VERSION)}
+
+    players = pa.Table.from_pandas(snapshot.players, preserve_index=False)
+    teams = pa.Table.from_pylist(snapshot.teams)
+
+    tmp_dir = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"))
+    try:
+        _write_table(players.replace_schema_metadata({**(players.schema.metadata or {}), **metadata}),
+                     tmp_dir / PLAYERS_FILE)
+        _write_table(teams.replace_schema_metadata(metadata), tmp_dir / TEAMS_FILE)
+        if snapshot.portal_rankings is not None:
+            rankings = pa.Table.from_pandas(snapshot.portal_rankings, preserve_index=False)
+            _write_table(rankings.replace_schema_metadata({**(rankings.schema.metadata or {}), **metadata}),
+                         tmp_dir / RANKINGS_FILE)
+        _rename_dir(tmp_dir, path)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def _rename_dir(src: Path, dst: Path) -> None:
+    """Rename a directory into place, moving aside (then removing) any directory already there."""
+    try:
+        os.rename(src, dst)
+        return
+    except OSError:
+        if not dst.exists():
+            raise
+    # Readers that already memory-mapped the old files keep their mapping
+    old = dst.with_name(f".{dst.name}.{uuid.uuid4().hex[:8]}.old")
+    try:
+        os.rename(dst, old)
+    except FileNotFoundError:
+        pass  # Another writer moved it first
+    os.rename(src, dst)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def read_league_snapshot(path: Path):
+    """
+    Load a LeagueSnapshot written by write_league_snapshot.
+
+    Numeric player columns without nulls stay zero-copy views of the
+    memory-mapped file.
+
+    Raises:
+        ValueError: If the files were written with a different format version
+    """
+    from src.data import LeagueSnapshot
+
+    players_table = _read_table(path / PLAYERS_FILE)
+    teams_table = _read_table(path / TEAMS_FILE)
+
+    for table in (players_table, teams_table):
+        version = (table.schema.metadata or {}).get(b"format_version", b"").decode()
+        if version != str(SNAPSHOT_FORMAT_VERSION):
+            raise ValueError(f"Snapshot format {version or 'unknown'} != {SNAPSHOT_FORMAT_VERSION}")
+
+    players = players_table.to_pandas(split_blocks=True)
+    teams = teams_table.to_pylist()
+    rankings = None
+    if (path / RANKINGS_FILE).exists():
+        rankings = _read_table(path / RANKINGS_FILE).to_pandas()
+
+    return LeagueSnapshot(teams, players, portal_rankings=rankings)
+
+
+def _season_dir(season: int) -> Path:
+    return PUBLISHED_DIR / f"league-{season}-v{SNAPSHOT_FORMAT_VERSION}"
+
+
+def _new_version() -> str:
+    """Version names sort in publish order: UTC timestamp (to the microsecond) plus a random suffix."""
+    now = time.time()
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now)) + f"{int(now % 1 * 1e6):06d}Z"
+    return f"{stamp}-{uuid.uuid4().hex[:6]}"
+
+
+def read_manifest(season: int) -> Optional[Dict]:
+    """
+    Get the season's published manifest (None if nothing is published).
+
+    Keys: version, season, format_version, published_at (epoch seconds),
+    teams and players (row counts), plus any metadata given at publish time.
+    """
+    try:
+        manifest = json.loads((_season_dir(season) / MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") else None
+
+
+def manifest_mtime(season: int) -> Optional[int]:
+    """Modification time (ns) of the season's manifest: a cheap "anything new?" check."""
+    try:
+        return os.stat(_season_dir(season) / MANIFEST_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def current_version(season: int) -> Optional[str]:
+    """Get the season's current published version (None if nothing is published)."""
+    manifest = read_manifest(season)
+    return manifest["version"] if manifest else None
+
+
+def version_path(season: int, version: str) -> Path:
+    """Get the directory of one published version."""
+    return _season_dir(season) / version
+
+
+def published_snapshot_path(season: int) -> Optional[Path]:
+    """Get the directory of the season's current published snapshot, if any."""
+    version = current_version(season)
+    return version_path(season, version) if version else None
+
+
+def list_versions(season: int) -> List[str]:
+    """Get the season's published versions, oldest first."""
+    season_dir = _season_dir(season)
+    if not season_dir.exists():
+        return []
+    return sorted(path.name for path in season_dir.iterdir() if path.is_dir() and not path.name.startswith("."))
+
+
+def publish_league_snapshot(
+    snapshot, season: int, keep: int = KEEP_VERSIONS, metadata: Optional[Dict] = None
+) -> str:
+    """
+    Publish a LeagueSnapshot as the season's new current version.
+
+    The files are written into a hidden temp directory, which is renamed to
+    its version name once complete (see write_league_snapshot); the
+    manifest is then written to a temp file and renamed over the old one. Older versions beyond `keep` are
+    removed (readers that still have one memory-mapped keep their mapping).
+
+    Args:
+        snapshot: The LeagueSnapshot to publish
+        season: Season it belongs to
+        keep: Versions to keep, the new one included
+        metadata: Extra manifest fields (e.g. scraped row counts)
+
+    Returns:
+        The published version name
+    """
+    season_dir = _season_dir(season)
+    season_dir.mkdir(parents=True, exist_ok=True)
+    version = _new_version()
+
+    write_league_snapshot(snapshot, version_path(season, version))
+
+    manifest = {
+        **(metadata or {}),
+        "version": version,
+        "season": season,
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "published_at": time.time(),
+        "teams": len(snapshot.teams),
+        "players": len(snapshot.players),
+    }
+    with tempfile.NamedTemporaryFile("w", dir=season_dir, prefix=f".{MANIFEST_FILE}.", suffix=".tmp",
+                                     delete=False) as tmp_manifest:
+        tmp_manifest.write(json.dumps(manifest, indent=1))
+    os.replace(tmp_manifest.name, season_dir / MANIFEST_FILE)
+
+    for old_version in list_versions(season)[:-keep] if keep > 0 else []:
+        if old_version != version:
+            shutil.rmtree(season_dir / old_version, ignore_errors=True)
+    return version
+
@@ -0,0 +1,160 @@
+"""
+Canonical Team Registry for NIL or Nothing
+
+Scraped sources spell schools differently: 247Sports destinations say
+"Ole Miss", ESPN stat tables say "MISS" or "Mississippi Rebels", and the
+dashboard's CONFERENCES / TEAM_LOGOS / TEAM_COLORS are keyed by display
+name. Every spelling is looked up once in an alias hash map and turned
+into an integer team ID (ESPN's team ID for the programs listed here), so
+later groupbys and joins run on small integer keys.
+
+Schools not in TEAMS are registered on first sight under the spelling
+first seen, with IDs from UNLISTED_ID_START up; those IDs are only stable
+within one process.
+"""
+
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Canonical name (as used by CONFERENCES / TEAM_LOGOS / TEAM_COLORS) ->
+# ESPN team ID, mascot and other spellings seen in the sources. Aliases
+# other schools share (UT, UM, CU, UA, SC, OSU, ...) are deliberately
+# left out: an unknown school is better than a wrong merge.
+TEAMS = {
+    "Georgia": {"id": 61, "mascot": "Bulldogs", "aliases": ["UGA", "GA"]},
+    "Alabama": {"id": 333, "mascot": "Crimson Tide", "aliases": ["ALA", "Bama"]},
+    "Ohio State": {"id": 194, "mascot": "Buckeyes", "aliases": ["Ohio St", "Ohio St.", "Ohio State University"]},
+    "Texas": {"id": 251, "mascot": "Longhorns", "aliases": ["TEX"]},
+    "Oregon": {"id": 2483, "mascot": "Ducks", "aliases": ["ORE"]},
+    "Penn State": {"id": 213, "mascot": "Nittany Lions", "aliases": ["PSU", "Penn St", "Penn St.", "Penn State University"]},
+    "Michigan": {"id": 130, "mascot": "Wolverines", "aliases": ["MICH"]},
+    "Notre Dame": {"id": 87, "mascot": "Fighting Irish", "aliases": ["ND"]},
+    "LSU": {"id": 99, "mascot": "Tigers", "aliases": ["Louisiana State", "Louisiana State University"]},
+    "USC": {"id": 30, "mascot": "Trojans", "aliases": ["Southern California", "Southern Cal"]},
+    "Florida State": {"id": 52, "mascot": "Seminoles", "aliases": ["FSU", "Florida St", "Florida St."]},
+    "Clemson": {"id": 228, "mascot": "Tigers", "aliases": ["CLEM"]},
+    "Tennessee": {"id": 2633, "mascot": "Volunteers", "aliases": ["TENN", "Tenn"]},
+    "Oklahoma": {"id": 201, "mascot": "Sooners", "aliases": ["OU", "OKLA"]},
+    "Miami": {"id": 2390, "mascot": "Hurricanes", "aliases": ["MIA", "Miami (FL)", "Miami FL", "Miami Florida"]},
+    "Florida": {"id": 57, "mascot": "Gators", "aliases": ["FLA", "UF"]},
+    "Auburn": {"id": 2, "mascot": "Tigers", "aliases": ["AUB"]},
+    "Texas A&M": {"id": 245, "mascot": "Aggies", "aliases": ["TAMU", "TA&M", "Texas AM", "Texas A and M"]},
+    "Wisconsin": {"id": 275, "mascot": "Badgers", "aliases": ["WIS", "WISC"]},
+    "Ole Miss": {"id": 145, "mascot": "Rebels", "aliases": ["Mississippi", "MISS"]},
+    "Colorado": {"id": 38, "mascot": "Buffaloes", "aliases": ["COLO"]},
+    "South Carolina": {"id": 2579, "mascot": "Gamecocks", "aliases": ["SCAR"]},
+    "Kentucky": {"id": 96, "mascot": "Wildcats", "aliases": ["UK", "UKY"]},
+    "Arizona": {"id": 12, "mascot": "Wildcats", "aliases": ["ARIZ"]},
+    "Missouri": {"id": 142, "mascot": "Tigers", "aliases": ["MIZ", "MIZZ", "Mizzou"]},
+}
+
+# IDs handed to schools that are not in TEAMS (above every ESPN ID used there)
+UNLISTED_ID_START = 100000
+
+# Team ID for a missing or blank team
+NO_TEAM = 0
+
+_PUNCTUATION = re.compile(r"[^a-z0-9& ]+")
+# Only prefixes: "<name> University" is often a different school (Miami University is Ohio's)
+_AFFIXES = re.compile(r"^(the |university of )")
+
+
+def team_key(name: Optional[str]) -> str:
+    """Alias lookup key: lowercase ASCII, periods and other punctuation dropped."""
+    if not isinstance(name, str):
+        return ""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    key = " ".join(_PUNCTUATION.sub(" ", ascii_name.replace(".", "").replace("'", "")).split())
+    return _AFFIXES.sub("", key).strip()
+
+
+class TeamRegistry:
+    """Alias hash map from any team spelling to an integer ID and canonical name."""
+
+    def __init__(self, teams: Dict[str, Dict] = TEAMS):
+        self._lock = threading.Lock()
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._next_id = UNLISTED_ID_START
+        for name, info in teams.items():
+            self._names[info["id"]] = name
+            for alias in [name, f"{name} {info['mascot']}", *info["aliases"]]:
+                self._ids[team_key(alias)] = info["id"]
+
+    def team_id(self, name: Optional[str]) -> int:
+        """ID for a team spelling (NO_TEAM if blank); unknown schools are registered."""
+        key = team_key(name)
+        if not key:
+            return NO_TEAM
+        team_id = self._ids.get(key)
+        if team_id is not None:
+            return team_id
+        with self._lock:
+            if key not in self._ids:
+                self._ids[key] = self._next_id
+                self._names[self._next_id] = " ".join(name.split())
+                self._next_id += 1
+            return self._ids[key]
+
+    def name(self, team_id: int) -> Optional[str]:
+        """Canonical name for an ID (None for NO_TEAM or an unknown ID)."""
+        return self._names.get(int(team_id))
+
+    def canonical(self, name: Optional[str]) -> Optional[str]:
+        """Canonical name for a team spelling (None if blank)."""
+        return self.name(self.team_id(name))
+
+    def ids(self, values: Iterable) -> np.ndarray:
+        """
+        Team IDs for a column of spellings.
+
+        Each distinct spelling is looked up once, so a column with millions
+        of rows costs one factorize plus a lookup per distinct school.
+        """
+        if not isinstance(values, pd.Series):
+            values = pd.Series(list(values), dtype=object)
+        codes, uniques = pd.factorize(values)
+        unique_ids = np.array([self.team_id(value) for value in uniques] + [NO_TEAM], dtype=np.int32)
+        return unique_ids[codes]  # code -1 (missing) picks the trailing NO_TEAM
+
+    def names(self, team_ids: Iterable[int]) -> List[Optional[str]]:
+        """Canonical names for a sequence of IDs."""
+        return [self.name(team_id) for team_id in team_ids]
+
+
+REGISTRY = TeamRegistry()
+
+
+def canonical_team(name: Optional[str]) -> Optional[str]:
+    """Canonical spelling of a team name (e.g. 'Mississippi' -> 'Ole Miss')."""
+    return REGISTRY.canonical(name)
+
+
+def canonicalize_teams(frame: pd.DataFrame, column: str, registry: TeamRegistry = REGISTRY) -> pd.DataFrame:
+    """
+    Normalize a frame's team column at ingest.
+
+    Adds an int32 `<column>_id` column and rewrites `column` with canonical
+    names, so different spellings of one school group together.
+
+    Args:
+        frame: Scraped rows
+        column: Team column ('destination', 'committed_to', 'team', ...)
+        registry: Registry to resolve spellings with
+
+    Returns:
+        The frame (modified in place); unchanged if it has no such column
+    """
+    if column not in frame.columns:
+        return frame
+    ids = registry.ids(frame[column])
+    distinct = pd.unique(ids)
+    names = dict(zip(distinct, registry.names(distinct)))
+    frame[f"{column}_id"] = ids
+    frame[column] = pd.Series(ids, index=frame.index).map(names)
+    return frame
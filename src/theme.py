@@ -104,8 +104,10 @@ TEAM_LOGOS = {
 
 
 def get_team_logo(team_name: str) -> str:
-    """Get the logo URL for a team."""
-    return TEAM_LOGOS.get(team_name, "")
+    """Get the logo URL for a team (any spelling in the team registry)."""
+    from src.teams import canonical_team
+
+    return TEAM_LOGOS.get(team_name) or TEAM_LOGOS.get(canonical_team(team_name), "")
 
 
 def get_custom_css():
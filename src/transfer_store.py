@@ -0,0 +1,274 @@
+"""
+SQLite Transfer Store for NIL or Nothing
+
+Optional backend for the Database page. Transfers live in an indexed
+SQLite table and each rerun's filter set compiles into a parameterized
+query, so a session only ever loads the rows on its current page.
+
+Enable it by pointing NIL_TRANSFER_DB at a database file. The file may be
+shared by several dashboard processes: the table records which stored
+rows it was built from (LeagueSnapshot.stored_key) and how many transfer
+event changes it has applied since, so a process only rebuilds it when it
+serves different stored rows, and an event only deletes and inserts its
+own rows.
+"""
+
+import os
+import sqlite3
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# Database file for the SQLite backend (unset = in-memory pandas filtering)
+TRANSFER_DB_PATH = os.environ.get("NIL_TRANSFER_DB")
+
+# Database page column -> SQL column
+COLUMN_MAP = {
+    "Player": "player",
+    "Position": "position",
+    "Class": "player_class",
+    "From": "from_team",
+    "To": "to_team",
+    "Rating": "rating",
+    "Score": "score",
+    "Value ($M)": "value",
+    "Games": "games",
+    "Date Transferred": "date_transferred",
+    "Type": "type",
+    "Conference": "conference",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transfers (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    position TEXT,
+    player_class TEXT,
+    from_team TEXT,
+    to_team TEXT,
+    rating REAL,
+    score REAL,
+    value REAL,
+    games INTEGER,
+    date_transferred TEXT,
+    type TEXT,
+    conference TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_transfers_conference ON transfers (conference, rating);
+CREATE INDEX IF NOT EXISTS idx_transfers_position ON transfers (position, rating);
+CREATE INDEX IF NOT EXISTS idx_transfers_from_team ON transfers (from_team, rating);
+CREATE INDEX IF NOT EXISTS idx_transfers_to_team ON transfers (to_team, rating);
+CREATE INDEX IF NOT EXISTS idx_transfers_type ON transfers (type, rating);
+CREATE INDEX IF NOT EXISTS idx_transfers_class ON transfers (player_class, rating);
+CREATE INDEX IF NOT EXISTS idx_transfers_rating ON transfers (rating);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def like_pattern(text: str) -> str:
+    """Substring LIKE pattern for user text, with its own % and _ matched literally (ESCAPE '\\')."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def compile_filters(filters: Dict) -> Tuple[str, List]:
+    """
+    Compile Database page filters into a WHERE clause and its parameters.
+
+    Recognized keys (missing or None = no filter): search, conference,
+    position, team (matches From or To), type, player_class, min_rating,
+    max_rating.
+    """
+    clauses = []
+    params = []
+
+    if filters.get("search"):
+        pattern = like_pattern(filters["search"])
+        clauses.append("(player LIKE ? ESCAPE '\\' OR from_team LIKE ? ESCAPE '\\'"
+                       " OR to_team LIKE ? ESCAPE '\\' OR position LIKE ? ESCAPE '\\')")
+        params.extend([pattern] * 4)
+
+    for key, column in (("conference", "conference"), ("position", "position"),
+                        ("type", "type"), ("player_class", "player_class")):
+        if filters.get(key) is not None:
+            clauses.append(f"{column} = ?")
+            params.append(filters[key])
+
+    if filters.get("team") is not None:
+        clauses.append("(from_team = ? OR to_team = ?)")
+        params.extend([filters["team"], filters["team"]])
+
+    if filters.get("min_rating") is not None:
+        clauses.append("rating >= ?")
+        params.append(filters["min_rating"])
+    if filters.get("max_rating") is not None:
+        clauses.append("rating <= ?")
+        params.append(filters["max_rating"])
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+class TransferStore:
+    """SQLite-backed transfer table with indexes on the Database page filters."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def is_empty(self) -> bool:
+        """Check whether the transfers table has no rows."""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM transfers LIMIT 1").fetchone() is None
+
+    @staticmethod
+    def _read_state(conn: sqlite3.Connection) -> Tuple[Optional[str], int]:
+        meta = dict(conn.execute("SELECT key, value FROM meta WHERE key IN ('source', 'changes')").fetchall())
+        return meta.get("source"), int(meta.get("changes", 0))
+
+    def state(self) -> Tuple[Optional[str], int]:
+        """(key of the rows the table was built from, changes applied since), see build and apply_changes."""
+        with closing(self._connect()) as conn:
+            return self._read_state(conn)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, transfers_df: pd.DataFrame) -> None:
+        """Insert transfers rows, using the frame's index as their IDs."""
+        columns = ["id"] + list(COLUMN_MAP.values())
+        rows = transfers_df[list(COLUMN_MAP.keys())].astype(object).itertuples(index=True, name=None)
+        conn.executemany(
+            f"INSERT INTO transfers ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            ((int(row[0]),) + row[1:] for row in rows),
+        )
+
+    def _transaction(self, conn: sqlite3.Connection) -> None:
+        # Taken before reading the state, so two processes never both apply the same change
+        conn.isolation_level = None
+        conn.execute("BEGIN IMMEDIATE")
+
+    def build(self, transfers_df: pd.DataFrame, key: Optional[str] = None) -> bool:
+        """
+        Replace the table contents with a Database page transfers frame.
+
+        The rows and their key are written in one transaction, so a reader
+        in another process sees either the old table or the new one, and
+        a process that finds `key` already built (e.g. by another process
+        serving the same rows) leaves the table alone.
+
+        Args:
+            transfers_df: Rows to store, indexed by row ID (see
+                data.LeagueSnapshot.stored_transfers_df)
+            key: Identity of the rows (data.LeagueSnapshot.stored_key)
+
+        Returns:
+            Whether the table was rebuilt
+        """
+        with closing(self._connect()) as conn:
+            self._transaction(conn)
+            try:
+                if key is not None and self._read_state(conn)[0] == key:
+                    conn.execute("ROLLBACK")
+                    return False
+                conn.execute("DELETE FROM transfers")
+                self._insert(conn, transfers_df)
+                conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                 [("source", key or ""), ("changes", "0")])
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("ANALYZE")
+        return True
+
+    def apply_changes(self, key: str, start: int, end: int, removed: List[int], added: pd.DataFrame) -> bool:
+        """
+        Delete and insert the rows of a run of transfer event changes.
+
+        Applied only while the table holds `key`'s rows with exactly
+        `start` changes applied; otherwise (e.g. another process got
+        there first) the table is left alone.
+
+        Args:
+            key: Key the table was built with
+            start: Changes the table holds (an index into the snapshot's row_changes)
+            end: Changes the table holds afterwards
+            removed: Row IDs to delete
+            added: Rows to insert, indexed by row ID (see
+                data.LeagueSnapshot.transfer_changes)
+
+        Returns:
+            Whether the changes were applied
+        """
+        with closing(self._connect()) as conn:
+            self._transaction(conn)
+            try:
+                if self._read_state(conn) != (key, start):
+                    conn.execute("ROLLBACK")
+                    return False
+                conn.executemany("DELETE FROM transfers WHERE id = ?", [(row_id,) for row_id in removed])
+                self._insert(conn, added)
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('changes', ?)", (str(end),))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return True
+
+    def summarize(self, filters: Dict) -> Dict:
+        """Count and aggregate the transfers matching the filters."""
+        where, params = compile_filters(filters)
+        with closing(self._connect()) as conn:
+            count, total_value, avg_score, avg_rating = conn.execute(
+                f"SELECT COUNT(*), SUM(value), AVG(score), AVG(rating) FROM transfers {where}", params
+            ).fetchone()
+
+        return {
+            "count": count,
+            "total_value": total_value or 0,
+            "avg_score": avg_score or 0,
+            "avg_rating": avg_rating or 0,
+        }
+
+    def page(self, filters: Dict, sort_col: str, ascending: bool, limit: int, offset: int) -> pd.DataFrame:
+        """
+        Get one sorted page of matching transfers.
+
+        Args:
+            filters: Filter dict (see compile_filters)
+            sort_col: Database page column name to sort by
+            ascending: Sort direction
+            limit: Rows per page
+            offset: Rows to skip
+
+        Returns:
+            DataFrame with the Database page columns
+        """
+        where, params = compile_filters(filters)
+        order = f"{COLUMN_MAP[sort_col]} {'ASC' if ascending else 'DESC'}, id"
+        select = ", ".join(f'{column} AS "{name}"' for name, column in COLUMN_MAP.items())
+
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                f"SELECT {select} FROM transfers {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                conn,
+                params=params + [limit, offset],
+            )
+
+
+_transfer_store: Optional[TransferStore] = None
+
+
+def get_transfer_store() -> Optional[TransferStore]:
+    """Get the configured SQLite transfer store, or None if NIL_TRANSFER_DB is unset."""
+    global _transfer_store
+    if TRANSFER_DB_PATH and _transfer_store is None:
+        _transfer_store = TransferStore(TRANSFER_DB_PATH)
+    return _transfer_store
@@ -12,7 +12,9 @@ Score = Σ(Player Rating × Position Multiplier × Class Weight) for gains
       - Σ(Player Rating × Position Multiplier × Class Weight) for losses
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Sequence
+
+import numpy as np
 
 # Class weights - more experienced players have immediate impact
 CLASS_WEIGHTS = {
@@ -227,8 +229,8 @@ def calculate_player_value(
     # Apply multipliers
     final_value = raw_value * pos_mult * class_mult
 
-    # Calculate score as well
-    score_data = calculate_player_score(hs_rating, games_played, stats_percentile, position, player_class)
+    # Calculate score as well (same formula as calculate_player_score)
+    player_score = round(composite_score * 100 * pos_mult * class_mult, 2)
 
     # Build breakdown
     breakdown = {
@@ -242,16 +244,104 @@ def calculate_player_value(
         "class_weight": class_mult,
         "raw_value": round(raw_value, 3),
         "final_value": round(final_value, 3),
-        "player_score": score_data["score"],
+        "player_score": player_score,
     }
 
     return {
         "value": round(final_value, 2),
-        "score": score_data["score"],
+        "score": player_score,
         "breakdown": breakdown,
     }
 
 
+def _lookup(keys: Sequence[str], table: Dict[str, float], default: float) -> np.ndarray:
+    """Map an array of labels to multipliers, looking each distinct label up once."""
+    labels, inverse = np.unique(np.asarray(keys, dtype=str), return_inverse=True)
+    mapped = np.array([table.get(label, default) for label in labels], dtype=float)
+    return mapped[inverse.reshape(-1)]
+
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Round an array like the builtin round().
+
+    np.round scales before rounding, which can land on the other side of a
+    .5 tie than round() does; near-ties are re-rounded in Python so batch
+    and scalar results agree exactly.
+    """
+    rounded = np.round(values, digits)
+    scaled = values * 10.0 ** digits
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    if len(ties):
+        rounded[ties] = [round(float(values[i]), digits) for i in ties]
+    return rounded
+
+
+def calculate_player_values(
+    hs_rating: Sequence[float],
+    games_played: Sequence[int],
+    stats_percentile: Optional[Sequence[Optional[float]]] = None,
+    position: Optional[Sequence[str]] = None,
+    player_class: Optional[Sequence[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate scores and values for many players at once.
+
+    Batch version of calculate_player_value: every argument is a column
+    (list, Series or array) of equal length, and missing stats percentiles
+    may be None or NaN. Returns a dict of NumPy columns holding the value,
+    score and every breakdown field, rounded like the scalar functions.
+    """
+    hs_rating = np.asarray(hs_rating, dtype=float)
+    games_played = np.asarray(games_played, dtype=float)
+    n = len(hs_rating)
+
+    if stats_percentile is None:
+        stats_percentile = np.full(n, np.nan)
+    else:
+        stats_percentile = np.asarray(stats_percentile, dtype=float)
+    if position is None:
+        position = ["LB"] * n
+    if player_class is None:
+        player_class = ["Junior"] * n
+
+    # Normalize HS rating
+    hs_normalized = np.clip((hs_rating - 0.7000) / 0.3000, 0, 1)
+
+    # Get weighting (see get_hs_weight)
+    hs_weight = np.select([games_played <= 5, games_played <= 20], [0.90, 0.50], default=0.20)
+    stats_weight = 1 - hs_weight
+
+    # Calculate composite score
+    has_stats = ~np.isnan(stats_percentile) & (games_played > 0)
+    blended = (hs_normalized * hs_weight) + (np.nan_to_num(stats_percentile) * stats_weight)
+    composite_score = np.where(has_stats, blended, hs_normalized)
+
+    # Get multipliers
+    pos_mult = _lookup(position, POSITION_MULTIPLIERS, 1.0)
+    class_mult = _lookup(player_class, CLASS_WEIGHTS, 1.0)
+
+    # Score and value
+    raw_score = composite_score * 100
+    final_score = raw_score * pos_mult * class_mult
+    raw_value = BASE_VALUE_MIN + (BASE_VALUE_MAX - BASE_VALUE_MIN) * (composite_score ** 1.5)
+    final_value = raw_value * pos_mult * class_mult
+
+    return {
+        "value": _round(final_value, 2),
+        "score": _round(final_score, 2),
+        "raw_score": _round(raw_score, 2),
+        "hs_normalized": _round(hs_normalized, 3),
+        "hs_weight": hs_weight,
+        "stats_weight": stats_weight,
+        "composite_score": _round(composite_score, 3),
+        "position_multiplier": pos_mult,
+        "class_weight": class_mult,
+        "raw_value": _round(raw_value, 3),
+        "final_value": _round(final_value, 3),
+    }
+
+
 def calculate_team_score(inflows: List[Dict], outflows: List[Dict]) -> Dict:
     """
     Calculate a team's total transfer portal score.
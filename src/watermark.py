@@ -0,0 +1,64 @@
+"""
+Scrape Watermarks for Incremental Refreshes
+
+A watermark records the fingerprints of every row a source returned for a
+season, plus when it last advanced. An incremental scrape compares each
+page against it: rows already in the watermark are dropped, and paging
+stops at the first page with nothing new, so a refresh costs roughly the
+pages that changed rather than max_pages.
+
+Layout under the watermark directory:
+    <source>-<year>.json    {"updated_at": ..., "fingerprints": [...]}
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, Set
+
+from src.http_cache import atomic_write
+
+
+def row_fingerprint(row: Dict) -> str:
+    """Stable hash of a scraped row's contents (independent of key order)."""
+    payload = json.dumps(row, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class WatermarkStore:
+    """Per-source, per-season sets of already-seen row fingerprints."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, source: str, year: int) -> Path:
+        return self.directory / f"{source}-{year}.json"
+
+    def load(self, source: str, year: int) -> Set[str]:
+        """Get the fingerprints recorded for a source and season (empty if none)."""
+        try:
+            data = json.loads(self._path(source, year).read_text())
+        except (OSError, ValueError):
+            return set()
+        return set(data.get("fingerprints", []))
+
+    def updated_at(self, source: str, year: int) -> float:
+        """Get when the watermark last advanced (0 if never)."""
+        try:
+            return json.loads(self._path(source, year).read_text()).get("updated_at", 0.0)
+        except (OSError, ValueError):
+            return 0.0
+
+    def save(self, source: str, year: int, fingerprints: Set[str]) -> None:
+        """Replace the watermark for a source and season."""
+        payload = json.dumps({"updated_at": time.time(), "fingerprints": sorted(fingerprints)})
+        atomic_write(self._path(source, year), payload.encode("utf-8"))
+
+    def clear(self, source: str, year: int) -> None:
+        """Forget a watermark so the next scrape walks every page again."""
+        try:
+            self._path(source, year).unlink()
+        except FileNotFoundError:
+            pass